@@ -0,0 +1,83 @@
+"""
+bench_assertion_typing.py — Microbenchmark for segmentText assertion typing
+
+Compares the original keyword-by-keyword tag_assertion_type against the
+compiled scorer and the batch tag_assertion_types, and checks all three agree.
+Run from the repository root: python benchmarks/bench_assertion_typing.py
+"""
+
+import os
+import random
+import sys
+import timeit
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+for sub in ("", "logic", "classifiers", "editors"):
+    sys.path.insert(0, os.path.join(SRC, sub))
+
+from segmentText import tag_assertion_type, tag_assertion_types
+
+def legacy_tag_assertion_type(assertion):
+    speculative_keywords = ["might", "could", "possibly", "maybe", "i think", "it seems"]
+    opinion_keywords = ["i believe", "in my opinion", "i feel", "should", "ought"]
+    question_keywords = ["who", "what", "why", "how", "when", "where"]
+
+    lowered = assertion.lower()
+    scores = {
+        "factual": 0.85,
+        "speculative": 0.0,
+        "opinion": 0.0,
+        "question": 0.0
+    }
+
+    for kw in speculative_keywords:
+        if kw in lowered:
+            scores["speculative"] += 0.2
+            scores["factual"] -= 0.1
+    for kw in opinion_keywords:
+        if kw in lowered:
+            scores["opinion"] += 0.2
+            scores["factual"] -= 0.1
+    for kw in question_keywords:
+        if lowered.startswith(kw) or lowered.endswith("?"):
+            scores["question"] += 0.5
+            scores["factual"] -= 0.2
+
+    best_type = max(scores, key=scores.get)
+    return {
+        "type": best_type,
+        "scores": {k: round(v, 2) for k, v in scores.items()}
+    }
+
+def make_assertions(count, seed=7):
+    rng = random.Random(seed)
+    openers = ["", "I think ", "In my opinion ", "Who says ", "Maybe ", "It seems ", "I believe ", "How "]
+    bodies = [
+        "the president could possibly sign the bill",
+        "vaccines should be free for everyone",
+        "gravity might explain the orbit",
+        "the election ought to be delayed",
+        "the movie was released in 1999",
+        "I feel the policy is working"
+    ]
+    endings = [".", "?", "", "!"]
+    pool = [rng.choice(openers) + rng.choice(bodies) + rng.choice(endings) for _ in range(500)]
+    return [rng.choice(pool) for _ in range(count)]
+
+def main(count=10000, repeat=5):
+    assertions = make_assertions(count)
+    expected = [legacy_tag_assertion_type(a) for a in assertions]
+    assert [tag_assertion_type(a) for a in assertions] == expected
+    assert tag_assertion_types(assertions) == expected
+
+    timings = {
+        "legacy": min(timeit.repeat(lambda: [legacy_tag_assertion_type(a) for a in assertions], number=1, repeat=repeat)),
+        "compiled": min(timeit.repeat(lambda: [tag_assertion_type(a) for a in assertions], number=1, repeat=repeat)),
+        "batch": min(timeit.repeat(lambda: tag_assertion_types(assertions), number=1, repeat=repeat))
+    }
+    for name, seconds in timings.items():
+        print(f"{name:>9}: {seconds * 1000:8.2f} ms for {count} assertions "
+              f"({timings['legacy'] / seconds:4.1f}x vs legacy)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+keywordMatcher.py — Compiled multi-keyword matcher (Aho-Corasick)
+
+Finds every occurrence of many keywords in a single pass over the text,
+so matching cost grows with text length rather than keyword count.
+Matching is plain substring matching; callers lower-case both sides when needed.
+Drafted collaboratively with Copilot and Bob Greenwade.
+"""
+
+from collections import deque
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of keywords.
+    Build once, then call find_all() or iter_matches() per text.
+    """
+
+    def __init__(self, keywords):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        self.keywords = []
+        self._always = ()
+
+        seen = set()
+        always = []
+        for keyword in keywords:
+            if keyword in seen:
+                continue
+            seen.add(keyword)
+            self.keywords.append(keyword)
+            if not keyword:
+                # The empty string is a substring of every text
+                always.append(keyword)
+                continue
+            self._insert(keyword)
+        self._always = tuple(always)
+        self._link_failures()
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def _insert(self, keyword):
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = nxt
+        self._output[state] = self._output[state] + (keyword,)
+
+    def _link_failures(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                if self._output[self._fail[nxt]]:
+                    self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def iter_matches(self, text):
+        """
+        Yields (start_index, keyword) for every occurrence, in order of match end.
+        The empty keyword, if present, is reported once at index 0.
+        """
+        for keyword in self._always:
+            yield 0, keyword
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for index, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for keyword in output[state]:
+                yield index - len(keyword) + 1, keyword
+
+    def find_all(self, text):
+        """
+        Returns the set of keywords that occur anywhere in text.
+        Equivalent to {k for k in keywords if k in text}.
+        """
+        found = set(self._always)
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
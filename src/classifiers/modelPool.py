@@ -0,0 +1,155 @@
+"""
+modelPool.py — Keeps loaded ML models warm for task routing
+
+Models are keyed by (package, task), loaded lazily on first request, and
+evicted least-recently-used first once the pool exceeds its memory budget
+(ML_MODEL_MEMORY_MB in config.json). Safe to share across threads.
+Drafted collaboratively with Copilot and Bob Greenwade.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from editors.configEditor import get_config_value
+from selectMachineLearning import load_package, ml_select_package
+
+DEFAULT_MODEL_MEMORY_MB = 2048
+DEFAULT_MODEL_SIZE_MB = 256
+
+# (package, task) → (loader, estimated size in MB)
+_model_loaders = {}
+
+def register_model_loader(package, task, loader, size_mb=DEFAULT_MODEL_SIZE_MB):
+    """
+    Registers how to build the model for (package, task).
+    loader(module) receives the imported package and returns the model;
+    size_mb is the estimated resident size used for budgeting.
+    """
+    _model_loaders[(package, task)] = (loader, size_mb)
+
+def _default_loader(module):
+    return module
+
+class ModelPool:
+    """
+    LRU pool of loaded models under a memory budget.
+    Concurrent requests for the same cold model share one load.
+    """
+
+    def __init__(self, memory_budget_mb=None):
+        self._budget_mb = memory_budget_mb
+        self._models = OrderedDict()  # (package, task) → (model, size_mb)
+        self._lock = threading.Lock()
+        self._loading = {}  # (package, task) → lock held while that model loads
+        self.stats = {"hits": 0, "loads": 0, "load_failures": 0, "evictions": 0, "load_seconds": 0.0}
+
+    @property
+    def memory_budget_mb(self):
+        if self._budget_mb is not None:
+            return self._budget_mb
+        return get_config_value("ML_MODEL_MEMORY_MB", DEFAULT_MODEL_MEMORY_MB)
+
+    def used_mb(self):
+        with self._lock:
+            return sum(size for _, size in self._models.values())
+
+    def _lookup(self, key):
+        entry = self._models.get(key)
+        if entry is None:
+            return None
+        self._models.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry
+
+    def get(self, package, task):
+        """
+        Returns the warm model for (package, task), loading it on first use.
+        Returns None if the package cannot be imported or the loader fails.
+        """
+        key = (package, task)
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                return entry[0]
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                entry = self._lookup(key)
+                if entry is not None:
+                    return entry[0]
+
+            loader, size_mb = _model_loaders.get(key, (_default_loader, DEFAULT_MODEL_SIZE_MB))
+            started = time.perf_counter()
+            module = load_package(package)
+            try:
+                model = loader(module) if module is not None else None
+            except Exception:
+                model = None
+            elapsed = time.perf_counter() - started
+
+            with self._lock:
+                self._loading.pop(key, None)
+                self.stats["load_seconds"] += elapsed
+                if model is None:
+                    self.stats["load_failures"] += 1
+                    return None
+                self.stats["loads"] += 1
+                self._models[key] = (model, size_mb)
+                self._evict_over_budget(keep=key)
+            return model
+
+    def get_for_task(self, task, context_features=None):
+        """
+        Routes task to a package via ml_select_package, then returns its warm model.
+        """
+        package = ml_select_package(task, context_features)
+        return self.get(package, task) if package else None
+
+    def _evict_over_budget(self, keep):
+        budget = self.memory_budget_mb
+        used = sum(size for _, size in self._models.values())
+        for key in list(self._models):
+            if used <= budget:
+                break
+            if key == keep:
+                continue
+            _, size = self._models.pop(key)
+            used -= size
+            self.stats["evictions"] += 1
+
+    def evict(self, package, task):
+        with self._lock:
+            return self._models.pop((package, task), None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+    def report(self):
+        with self._lock:
+            return {
+                **self.stats,
+                "resident": [f"{pkg}:{task}" for pkg, task in self._models],
+                "used_mb": sum(size for _, size in self._models.values()),
+                "budget_mb": self.memory_budget_mb
+            }
+
+# 🔥 Shared Pool
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+def get_model_pool():
+    global _default_pool
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                _default_pool = ModelPool()
+    return _default_pool
+
+def get_model(task, package=None):
+    """
+    Returns a warm model for task from the shared pool.
+    """
+    pool = get_model_pool()
+    return pool.get(package, task) if package else pool.get_for_task(task)
@@ -2,10 +2,13 @@
 selectMachineLearning.py — Detects and selects available ML packages
 
 Supports modular fallback, score-based selection, and future ML routing.
+Detection uses importlib.util.find_spec (cached); packages are imported only via load_package().
 Drafted collaboratively with Copilot and Bob Greenwade.
 """
 
 import importlib
+import importlib.util
+import threading
 
 ML_PACKAGES = {
     "spacy": "spaCy NLP",
@@ -17,15 +20,50 @@ ML_PACKAGES = {
     "cohere": "Cohere API"
 }
 
+# Detected once per process; cleared by refresh_installed_packages()
+_installed_packages = None
+_detection_lock = threading.Lock()
+
+def _is_installed(pkg):
+    """
+    Checks importability via find_spec, without executing the package.
+    """
+    try:
+        return importlib.util.find_spec(pkg) is not None
+    except (ImportError, ValueError):
+        return False
+
 def check_installed_packages():
-    available = {}
-    for pkg in ML_PACKAGES:
-        try:
-            importlib.import_module(pkg)
-            available[pkg] = ML_PACKAGES[pkg]
-        except ImportError:
-            continue
-    return available
+    global _installed_packages
+    available = _installed_packages
+    if available is None:
+        with _detection_lock:
+            if _installed_packages is None:
+                _installed_packages = {pkg: desc for pkg, desc in ML_PACKAGES.items() if _is_installed(pkg)}
+            available = _installed_packages
+    return dict(available)
+
+def refresh_installed_packages():
+    """
+    Forgets cached detection (e.g. after pip installs) and detects again.
+    """
+    global _installed_packages
+    with _detection_lock:
+        _installed_packages = None
+    importlib.invalidate_caches()
+    return check_installed_packages()
+
+def load_package(pkg):
+    """
+    Imports a package chosen by select_best_package/ml_select_package.
+    Deferred until a caller actually needs the module; returns None if the import fails.
+    """
+    if pkg is None:
+        return None
+    try:
+        return importlib.import_module(pkg)
+    except ImportError:
+        return None
 
 def score_package_for_task(pkg, task):
     """
@@ -9,9 +9,48 @@ Drafted collaboratively with Copilot and Bob Greenwade.
 from editors import registryEditor
 from syncGlyphs import get_sync_lineage  # Optional: symbolic trust lineage
 
+RELIABILITY_MAP = {"high": 1.0, "medium": 0.7, "low": 0.4}
+BIAS_PENALTY = {
+    "neutral": 0.0,
+    "slightly progressive": -0.1,
+    "conservative": -0.2
+}
+TONE_BONUS = {
+    "clinical": 0.1,
+    "academic": 0.1,
+    "playful": 0.05
+}
+
+# 🗂️ Ranked Source Index
+# Registry snapshot plus (topic, persona) → sources sorted by trust; rebuilt per registry version
+_ranked_index = {"version": None, "registry": {}, "ranked": {}}
+
+def _get_ranked_index():
+    global _ranked_index
+    version = registryEditor.get_registry_version()
+    index = _ranked_index
+    if index["version"] != version:
+        index = {"version": version, "registry": registryEditor.load_registry(), "ranked": {}}
+        _ranked_index = index
+    return index
+
+def get_ranked_sources(topic, persona="default"):
+    """
+    Returns (source, trust) pairs for topic, best first.
+    Sorted once per registry version and persona, then served from the index.
+    """
+    index = _get_ranked_index()
+    key = (topic, persona)
+    ranked = index["ranked"].get(key)
+    if ranked is None:
+        scored = [(s, rank_source_trust(s, persona)) for s in index["registry"].get(topic, [])]
+        scored.sort(key=lambda x: x[1], reverse=True)
+        ranked = tuple(scored)
+        index["ranked"][key] = ranked
+    return ranked
+
 def get_sources_for_topic(topic):
-    registry = registryEditor.load_registry()
-    return registry.get(topic, [])
+    return list(_get_ranked_index()["registry"].get(topic, []))
 
 def evaluate_source_viability(assertion_type, topic):
     supported_topics = ["politics", "science", "history", "health", "technology", "finance"]
@@ -29,28 +68,20 @@ def select_source_type(topic, assertion):
         return "knowledge_base"
 
 def rank_source_trust(source_metadata, persona="default"):
-    reliability_map = {"high": 1.0, "medium": 0.7, "low": 0.4}
-    bias_penalty = {
-        "neutral": 0.0,
-        "slightly progressive": -0.1,
-        "conservative": -0.2
-    }
-    tone_bonus = {
-        "clinical": 0.1,
-        "academic": 0.1,
-        "playful": 0.05
-    }
-
-    score = reliability_map.get(source_metadata.get("reliability"), 0.5)
-    score += tone_bonus.get(source_metadata.get("tone"), 0.0)
-    score += bias_penalty.get(source_metadata.get("bias"), 0.0)
+    score = RELIABILITY_MAP.get(source_metadata.get("reliability"), 0.5)
+    score += TONE_BONUS.get(source_metadata.get("tone"), 0.0)
+    score += BIAS_PENALTY.get(source_metadata.get("bias"), 0.0)
     return max(0.0, min(score, 1.0))
 
 def select_best_source(topic, persona="default"):
-    sources = get_sources_for_topic(topic)
-    scored = [(s, rank_source_trust(s, persona)) for s in sources]
-    scored.sort(key=lambda x: x[1], reverse=True)
-    return scored[0][0] if scored else None
+    ranked = get_ranked_sources(topic, persona)
+    return ranked[0][0] if ranked else None
+
+def select_top_sources(topic, persona="default", top_k=3):
+    """
+    Returns up to top_k sources for topic, best first, without re-sorting.
+    """
+    return [source for source, _ in get_ranked_sources(topic, persona)[:top_k]]
 
 def get_source_lineage(source_name):
     """
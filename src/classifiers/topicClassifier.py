@@ -2,51 +2,161 @@
 topicClassifier.py — Classifies assertions by topic/domain
 
 Uses topic_tree.json for dynamic classification, editorial routing, and sensitivity tagging.
+Reads the shared TopicTree snapshot published by topicEditor.
 Drafted collaboratively with Copilot and Bob Greenwade.
 """
 
-import json
-import os
 from editors.configEditor import get_config_value
+from editors.topicEditor import TOPIC_TREE_PATH, get_topic_tree, load_topic_tree
+from keywordMatcher import KeywordMatcher
 
-TOPIC_TREE_PATH = "topic_tree.json"
+# Below this many assertions the plain Python path beats NumPy's setup cost
+VECTORIZE_MIN_BATCH = 64
 
-def classify_topic(assertion):
-    tree = load_topic_tree()
-    lowered = assertion.lower()
-    topic_scores = {}
-    threshold = get_config_value("TOPIC_MATCH_THRESHOLD", 0.2)
+_numpy = None
+_numpy_checked = False
 
+def _load_numpy():
+    """
+    Imports NumPy the first time a batch reaches VECTORIZE_MIN_BATCH, so short runs skip its import cost.
+    Returns the module, or None when NumPy is not installed.
+    """
+    global _numpy, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = None  # classify_topics falls back to the per-assertion path
+        _numpy_checked = True
+    return _numpy
+
+def compile_topic_tree(tree):
+    """
+    Compiles topic keywords into one automaton.
+    Returns the matcher, keyword → [(topic, multiplicity)], and per-topic keyword counts.
+    """
+    keyword_topics = {}
     for topic, metadata in tree.items():
-        keywords = metadata.get("keywords", [])
-        hits = sum(1 for term in keywords if term.lower() in lowered)
-        if hits:
-            score = round(min(1.0, hits / len(keywords)), 2)
-            if score >= threshold:
-                topic_scores[topic] = score
+        multiplicity = {}
+        for term in metadata.get("keywords", []):
+            lowered_term = term.lower()
+            multiplicity[lowered_term] = multiplicity.get(lowered_term, 0) + 1
+        for lowered_term, count in multiplicity.items():
+            keyword_topics.setdefault(lowered_term, []).append((topic, count))
+    topic_order = {topic: i for i, topic in enumerate(tree)}
+    return {
+        "matcher": KeywordMatcher(keyword_topics),
+        "keyword_topics": keyword_topics,
+        "keyword_columns": {
+            term: [(topic_order[topic], count) for topic, count in pairs]
+            for term, pairs in keyword_topics.items()
+        },
+        "keyword_counts": tree.keyword_counts,
+        "topic_names": list(tree),
+        "topic_order": topic_order
+    }
+
+def get_compiled_topic_tree(path=TOPIC_TREE_PATH):
+    """
+    Returns the compiled matcher for the current TopicTree snapshot.
+    Rebuilt only when topicEditor publishes a new snapshot.
+    """
+    return get_topic_tree(path).derive("classifier", compile_topic_tree)
+
+def score_topics(lowered, compiled, threshold):
+    """
+    Scores one lower-cased assertion against a compiled topic tree.
+    A keyword counts once per listing in its topic, however often it appears in the text.
+    """
+    hits = {}
+    keyword_topics = compiled["keyword_topics"]
+    for term in compiled["matcher"].find_all(lowered):
+        for topic, count in keyword_topics[term]:
+            hits[topic] = hits.get(topic, 0) + count
+
+    topic_scores = {}
+    keyword_counts = compiled["keyword_counts"]
+    for topic in sorted(hits, key=compiled["topic_order"].get):
+        score = round(min(1.0, hits[topic] / keyword_counts[topic]), 2)
+        if score >= threshold:
+            topic_scores[topic] = score
+    return topic_scores
+
+def score_topics_vectorized(lowered_assertions, compiled, threshold):
+    """
+    Scores many lower-cased assertions with one sparse assertions × topics hit matrix.
+    Normalization and thresholding run as single NumPy steps over all hit cells.
+    """
+    np = _load_numpy()
+    topic_names = compiled["topic_names"]
+    keyword_columns = compiled["keyword_columns"]
+    find_all = compiled["matcher"].find_all
+
+    rows, cols, weights = [], [], []
+    for row, lowered in enumerate(lowered_assertions):
+        for term in find_all(lowered):
+            for col, count in keyword_columns[term]:
+                rows.append(row)
+                cols.append(col)
+                weights.append(count)
+
+    results = [{} for _ in lowered_assertions]
+    if not rows:
+        return results
+
+    n_topics = len(topic_names)
+    counts = np.array([compiled["keyword_counts"][t] for t in topic_names], dtype=np.float64)
+    cells = np.asarray(rows, dtype=np.int64) * n_topics + np.asarray(cols, dtype=np.int64)
+    cells, cell_index = np.unique(cells, return_inverse=True)
+    hits = np.bincount(cell_index, weights=weights)
+    cell_rows, cell_cols = np.divmod(cells, n_topics)
 
-    return topic_scores if topic_scores else {"general": 0.1}
+    ratios = np.minimum(1.0, hits / counts[cell_cols])
+    # Python's round() on the few distinct ratios keeps scores identical to score_topics()
+    levels, level_index = np.unique(ratios, return_inverse=True)
+    scores = np.array([round(float(level), 2) for level in levels])[level_index]
+    keep = np.nonzero(scores >= threshold)[0]
 
-def load_topic_tree(path=TOPIC_TREE_PATH):
-    if not os.path.exists(path):
-        return {}
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    for row, col, score in zip(cell_rows[keep].tolist(), cell_cols[keep].tolist(), scores[keep].tolist()):
+        results[row][topic_names[col]] = score
+    return results
+
+def classify_topics(assertions):
+    """
+    Classifies a batch of assertions in one pass.
+    Returns one score dict per assertion, identical to classify_topic().
+    """
+    compiled = get_compiled_topic_tree()
+    threshold = get_config_value("TOPIC_MATCH_THRESHOLD", 0.2)
+    lowered = [a.lower() for a in assertions]
+
+    if len(lowered) >= VECTORIZE_MIN_BATCH and _load_numpy() is not None:
+        results = score_topics_vectorized(lowered, compiled, threshold)
+    else:
+        results = [score_topics(a, compiled, threshold) for a in lowered]
+    return [scores if scores else {"general": 0.1} for scores in results]
+
+def classify_topic(assertion):
+    return classify_topics([assertion])[0]
 
 def route_to_source_cluster(topic):
     """
     Maps topic to source registry cluster using topic tree metadata.
     """
-    tree = load_topic_tree()
-    return tree.get(topic, {}).get("source_cluster", "general")
+    return get_topic_tree().source_cluster(topic)
 
 def flag_sensitive_topic(topic):
     """
     Flags topics that require editorial caution.
     """
-    tree = load_topic_tree()
-    return tree.get(topic, {}).get("sensitive", False)
+    return get_topic_tree().is_sensitive(topic)
 
-def get_primary_topic(assertion):
-    scores = classify_topic(assertion)
+def top_topic(scores):
+    """
+    Returns the highest-scoring topic from a classify_topic() score dict.
+    """
     return max(scores, key=scores.get) if scores else "general"
+
+def get_primary_topic(assertion):
+    return top_topic(classify_topic(assertion))
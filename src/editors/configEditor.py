@@ -2,33 +2,165 @@
 configEditor.py — Manages runtime configuration for Fact-Check and editorial modules
 
 Supports persona defaults, fallback behavior, ML routing, and editorial tone settings.
+Reads go through a process-wide snapshot that is revalidated by file mtime.
+Writes are atomic (temp file + rename) and serialized across workers by a lock file.
 Drafted collaboratively with Copilot and Bob Greenwade.
 """
 
 import json
 import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from types import MappingProxyType
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 CONFIG_PATH = "config.json"
 
+# Seconds between stat() checks of config.json; reads in between are plain dict lookups
+CONFIG_REVALIDATE_INTERVAL = 1.0
+
+# 🗂️ Config Snapshot Cache
+# path → (file stamp, last checked, read-only config); entries are swapped whole, never mutated
+_config_snapshots = {}
+_config_lock = threading.Lock()
+config_cache_stats = {"hits": 0, "reloads": 0, "checks": 0}
+
 def load_config(path=CONFIG_PATH):
     if not os.path.exists(path):
         return {}
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
+# 🔒 Locked, Atomic Writes
+@contextmanager
+def locked_file(path):
+    """
+    Holds an exclusive advisory lock on path + ".lock" for the duration of the block.
+    Not re-entrant: do not nest two locks on the same path.
+    """
+    with open(path + ".lock", "a+") as handle:
+        if fcntl:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+def atomic_write_json(data, path):
+    """
+    Writes JSON to a temp file beside path, then renames it over path.
+    Readers see either the old file or the new one, never a partial write.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _write_config(config, path):
+    atomic_write_json(config, path)
+    _publish_config(config, path)
+
 def save_config(config, path=CONFIG_PATH):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    with locked_file(path):
+        _write_config(config, path)
+
+@contextmanager
+def config_transaction(path=CONFIG_PATH):
+    """
+    Yields a mutable copy of the current config under the config lock.
+    The whole dict is written once, atomically, when the block exits cleanly;
+    an exception inside the block leaves config.json untouched.
+    """
+    with locked_file(path):
+        config = load_config(path)
+        yield config
+        _write_config(config, path)
+
+def _stat_config(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _publish_config(config, path=CONFIG_PATH):
+    """
+    Swaps in a new read-only snapshot for path.
+    """
+    snapshot = MappingProxyType(dict(config))
+    _config_snapshots[path] = (_stat_config(path), time.monotonic(), snapshot)
+    return snapshot
+
+def get_config_snapshot(path=CONFIG_PATH):
+    """
+    Returns the current read-only config for path.
+    Loads once, then re-stats the file at most every CONFIG_REVALIDATE_INTERVAL seconds
+    and reloads only when its mtime or size changed.
+    """
+    entry = _config_snapshots.get(path)
+    now = time.monotonic()
+    if entry is not None and now - entry[1] < CONFIG_REVALIDATE_INTERVAL:
+        config_cache_stats["hits"] += 1
+        return entry[2]
+
+    with _config_lock:
+        entry = _config_snapshots.get(path)
+        config_cache_stats["checks"] += 1
+        stamp = _stat_config(path)
+        if entry is not None and entry[0] == stamp:
+            _config_snapshots[path] = (stamp, now, entry[2])
+            config_cache_stats["hits"] += 1
+            return entry[2]
+        config_cache_stats["reloads"] += 1
+        return _publish_config(load_config(path) if stamp else {}, path)
+
+def invalidate_config_cache(path=None):
+    """
+    Drops cached snapshots so the next read goes back to disk.
+    """
+    if path is None:
+        _config_snapshots.clear()
+    else:
+        _config_snapshots.pop(path, None)
+
+def get_config_cache_stats():
+    return dict(config_cache_stats)
 
 def update_config(key, value):
-    config = load_config()
-    config[key] = value
-    save_config(config)
+    return update_config_many({key: value})
+
+def update_config_many(updates, path=CONFIG_PATH):
+    """
+    Applies several key/value updates with a single locked read-modify-write.
+    """
+    with config_transaction(path) as config:
+        config.update(updates)
     return True
 
 def get_config_value(key, default=None):
-    config = load_config()
-    return config.get(key, default)
+    return get_config_snapshot().get(key, default)
 
 def reset_config():
     default_config = {
@@ -45,7 +177,7 @@ def reset_config():
     return default_config
 
 def describe_config():
-    config = load_config()
+    config = get_config_snapshot()
     return {
         "persona": config.get("DEFAULT_PERSONA", "default"),
         "tone": config.get("EDITORIAL_TONE", "neutral"),
@@ -57,4 +189,4 @@ def describe_config():
 
 def config_exists(path=CONFIG_PATH):
     return os.path.exists(path)
-    
+
@@ -3,30 +3,52 @@ registryEditor.py — Manage trusted source registry for Fact-Check module
 
 Allows manual or programmatic updates to the source registry, including tagging for reliability, bias, editorial tone, and domain relevance.
 Now includes symbolic glyph casting for editorial sync lineage.
+Storage is pluggable (JSON file or SQLite) via registryStore.py.
 Drafted collaboratively with Copilot and Bob Greenwade.
 """
 
-import json
-import os
+import time
+from editors.registryStore import REGISTRY_PATH, get_registry_store, read_registry_json
 from syncGlyphs import generate_sync_glyph, register_sync_glyph, describe_sync_ritual
 
-REGISTRY_PATH = "source_registry.json"
+def load_registry(path=None):
+    """
+    Returns the registry as {domain: [source, ...]}.
+    Reads the active store (see REGISTRY_BACKEND) unless a JSON path is given.
+    """
+    if path is not None:
+        return read_registry_json(path)
+    return get_registry_store().load_all()
 
-def load_registry(path=REGISTRY_PATH):
-    if not os.path.exists(path):
-        return {}
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+def save_registry(data, path=None):
+    if path is not None:
+        get_registry_store("json", path).replace_all(data)
+    else:
+        get_registry_store().replace_all(data)
 
-def save_registry(data, path=REGISTRY_PATH):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+def get_registry_version():
+    """
+    Returns a token that changes whenever the registry does,
+    whether edited in this process or by another writer.
+    """
+    return get_registry_store().version()
+
+def import_registry_json(path=REGISTRY_PATH):
+    """
+    Replaces the active store's contents with a source_registry.json-format file.
+    """
+    get_registry_store().import_json(path)
+    return True
+
+def export_registry_json(path=REGISTRY_PATH):
+    """
+    Writes the active store's contents in source_registry.json format.
+    """
+    get_registry_store().export_json(path)
+    return True
 
 def add_source(domain, name, url, reliability, bias=None, tone=None, notes=None):
-    registry = load_registry()
-    if domain not in registry:
-        registry[domain] = []
-    registry[domain].append({
+    get_registry_store().add_source(domain, {
         "name": name,
         "url": url,
         "reliability": reliability,
@@ -34,7 +56,6 @@ def add_source(domain, name, url, reliability, bias=None, tone=None, notes=None)
         "tone": tone,
         "notes": notes
     })
-    save_registry(registry)
 
     # 🧬 Cast glyph for source addition
     glyph = generate_sync_glyph("manual_add", name)
@@ -44,28 +65,19 @@ def add_source(domain, name, url, reliability, bias=None, tone=None, notes=None)
     return True
 
 def update_source(domain, name, updates):
-    registry = load_registry()
-    if domain not in registry:
+    if not get_registry_store().update_source(domain, name, updates):
         return False
-    for source in registry[domain]:
-        if source["name"] == name:
-            source.update(updates)
-            save_registry(registry)
 
-            # 🧬 Cast glyph for source update
-            glyph = generate_sync_glyph("manual_update", name)
-            register_sync_glyph(glyph)
-            print(f"[GLYPH] Updated source '{name}' → {describe_sync_ritual(glyph)}")
+    # 🧬 Cast glyph for source update
+    glyph = generate_sync_glyph("manual_update", name)
+    register_sync_glyph(glyph)
+    print(f"[GLYPH] Updated source '{name}' → {describe_sync_ritual(glyph)}")
 
-            return True
-    return False
+    return True
 
 def remove_source(domain, name):
-    registry = load_registry()
-    if domain not in registry:
+    if not get_registry_store().remove_source(domain, name):
         return False
-    registry[domain] = [s for s in registry[domain] if s["name"] != name]
-    save_registry(registry)
 
     # 🧬 Cast glyph for source removal
     glyph = generate_sync_glyph("manual_remove", name)
@@ -73,3 +85,91 @@ def remove_source(domain, name):
     print(f"[GLYPH] Removed source '{name}' → {describe_sync_ritual(glyph)}")
 
     return True
+
+# 📦 Bulk Changes
+RELIABILITY_LEVELS = ("high", "medium", "low")
+
+def validate_registry_change(change):
+    """
+    Returns a list of problems with one change dict; empty if it can be applied.
+    """
+    problems = []
+    op = change.get("op")
+    if op not in ("add", "update", "remove"):
+        return [f"unknown op {op!r}"]
+    if not change.get("domain"):
+        problems.append("missing domain")
+    if op == "add":
+        source = change.get("source") or {}
+        if not source.get("name"):
+            problems.append("missing source name")
+        if not source.get("url"):
+            problems.append("missing source url")
+        if source.get("reliability") not in RELIABILITY_LEVELS:
+            problems.append(f"reliability must be one of {RELIABILITY_LEVELS}")
+    else:
+        if not change.get("name"):
+            problems.append("missing name")
+        if op == "update":
+            updates = change.get("updates")
+            if not isinstance(updates, dict) or not updates:
+                problems.append("missing updates")
+            elif "reliability" in updates and updates["reliability"] not in RELIABILITY_LEVELS:
+                problems.append(f"reliability must be one of {RELIABILITY_LEVELS}")
+    return problems
+
+def apply_registry_changes(changes, announce=True):
+    """
+    Validates a whole batch of add/update/remove changes, then applies it in a single write.
+    Casts one batch glyph listing every touched source instead of one glyph per change.
+    Raises ValueError (and writes nothing) if any change is invalid.
+    Returns counts, per-change results, and throughput.
+    """
+    started = time.perf_counter()
+    changes = list(changes)
+    errors = []
+    for i, change in enumerate(changes):
+        errors.extend(f"change {i}: {problem}" for problem in validate_registry_change(change))
+    if errors:
+        raise ValueError("Invalid registry changes: " + "; ".join(errors))
+
+    results = get_registry_store().apply_changes(changes) if changes else []
+    applied = [
+        change["source"]["name"] if change["op"] == "add" else change["name"]
+        for change, ok in zip(changes, results) if ok
+    ]
+
+    # 🧬 Cast one glyph for the whole batch
+    glyph = None
+    if applied:
+        glyph = generate_sync_glyph("bulk_change", f"{len(applied)} sources")
+        glyph["targets"] = applied
+        register_sync_glyph(glyph, announce=False)
+
+    elapsed = time.perf_counter() - started
+    report = {
+        "submitted": len(changes),
+        "applied": len(applied),
+        "results": results,
+        "glyph": glyph["glyph"] if glyph else None,
+        "elapsed_seconds": round(elapsed, 4),
+        "changes_per_second": round(len(changes) / elapsed, 1) if elapsed > 0 else None
+    }
+    if announce and glyph:
+        print(f"[GLYPH] Applied {len(applied)}/{len(changes)} registry changes "
+              f"({report['changes_per_second']}/s) → {describe_sync_ritual(glyph)}")
+    return report
+
+def add_sources(sources, announce=True):
+    """
+    Bulk version of add_source: sources is an iterable of dicts with
+    domain, name, url, reliability, and optional bias, tone, notes.
+    """
+    changes = []
+    for source in sources:
+        source = dict(source)
+        domain = source.pop("domain", None)
+        entry = {field: source.pop(field, None) for field in ("name", "url", "reliability", "bias", "tone", "notes")}
+        entry.update(source)
+        changes.append({"op": "add", "domain": domain, "source": entry})
+    return apply_registry_changes(changes, announce)
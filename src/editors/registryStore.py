@@ -0,0 +1,319 @@
+"""
+registryStore.py — Storage backends for the trusted source registry
+
+JsonRegistryStore keeps the original source_registry.json layout.
+SqliteRegistryStore keeps sources as rows in a local SQLite file (WAL mode,
+indexed by domain and name) so edits touch one row instead of the whole file.
+JSON stays the interchange format: both stores import and export it.
+Drafted collaboratively with Copilot and Bob Greenwade.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from editors.configEditor import atomic_write_json, get_config_value, locked_file
+
+REGISTRY_PATH = "source_registry.json"
+REGISTRY_DB_PATH = "source_registry.db"
+
+# Fields stored as columns; anything else (e.g. "trust") rides along in the extra JSON column
+SOURCE_FIELDS = ("name", "url", "reliability", "bias", "tone", "notes")
+
+def read_registry_json(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+class JsonRegistryStore:
+    """
+    Registry kept as one JSON document; every edit is a locked, atomic rewrite.
+    """
+    backend = "json"
+
+    def __init__(self, path=REGISTRY_PATH):
+        self.path = path
+        self._edits = 0
+
+    def load_all(self):
+        return read_registry_json(self.path)
+
+    def replace_all(self, data):
+        with locked_file(self.path):
+            atomic_write_json(data, self.path)
+            self._edits += 1
+
+    def _edit(self, edit):
+        with locked_file(self.path):
+            registry = read_registry_json(self.path)
+            result = edit(registry)
+            if result:
+                atomic_write_json(registry, self.path)
+                self._edits += 1
+            return result
+
+    @staticmethod
+    def _add(registry, domain, entry):
+        registry.setdefault(domain, []).append(dict(entry))
+        return True
+
+    @staticmethod
+    def _update(registry, domain, name, updates):
+        for source in registry.get(domain, []):
+            if source["name"] == name:
+                source.update(updates)
+                return True
+        return False
+
+    @staticmethod
+    def _remove(registry, domain, name):
+        if domain not in registry:
+            return False
+        registry[domain] = [s for s in registry[domain] if s["name"] != name]
+        return True
+
+    def add_source(self, domain, entry):
+        return self._edit(lambda registry: self._add(registry, domain, entry))
+
+    def update_source(self, domain, name, updates):
+        return self._edit(lambda registry: self._update(registry, domain, name, updates))
+
+    def remove_source(self, domain, name):
+        return self._edit(lambda registry: self._remove(registry, domain, name))
+
+    def apply_changes(self, changes):
+        """
+        Applies a list of add/update/remove changes with one read and one write.
+        Returns one bool per change.
+        """
+        results = []
+        def edit(registry):
+            for change in changes:
+                results.append(_apply_change(self, registry, change))
+            return any(results)
+        self._edit(edit)
+        return results
+
+    def version(self):
+        try:
+            stat = os.stat(self.path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        return (self._edits, stamp)
+
+    def import_json(self, path):
+        self.replace_all(read_registry_json(path))
+
+    def export_json(self, path):
+        atomic_write_json(self.load_all(), path)
+
+class SqliteRegistryStore:
+    """
+    Registry kept in SQLite: one row per source, row-level edits, WAL journaling.
+    A version counter in registry_meta is bumped inside every write transaction,
+    so readers in other processes can tell when to rebuild their indexes.
+    """
+    backend = "sqlite"
+
+    def __init__(self, path=REGISTRY_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._init_schema()
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        conn = self._connect()
+        with conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS sources (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    domain TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    url TEXT,
+                    reliability TEXT,
+                    bias TEXT,
+                    tone TEXT,
+                    notes TEXT,
+                    extra TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_sources_domain ON sources(domain, id);
+                CREATE INDEX IF NOT EXISTS idx_sources_name ON sources(name);
+                CREATE TABLE IF NOT EXISTS registry_meta (key TEXT PRIMARY KEY, value INTEGER);
+                INSERT OR IGNORE INTO registry_meta (key, value) VALUES ('version', 0);
+            """)
+
+    @staticmethod
+    def _to_row(domain, entry):
+        extra = {k: v for k, v in entry.items() if k not in SOURCE_FIELDS}
+        return (domain,) + tuple(entry.get(k) for k in SOURCE_FIELDS) + (json.dumps(extra) if extra else None,)
+
+    @staticmethod
+    def _from_row(row):
+        source = dict(zip(SOURCE_FIELDS, row[:len(SOURCE_FIELDS)]))
+        if row[-1]:
+            source.update(json.loads(row[-1]))
+        return source
+
+    def _bump_version(self, conn):
+        conn.execute("UPDATE registry_meta SET value = value + 1 WHERE key = 'version'")
+
+    def _add(self, conn, domain, entry):
+        conn.execute(
+            "INSERT INTO sources (domain, name, url, reliability, bias, tone, notes, extra) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            self._to_row(domain, entry)
+        )
+        return True
+
+    def _update(self, conn, domain, name, updates):
+        row = conn.execute(
+            "SELECT id, name, url, reliability, bias, tone, notes, extra FROM sources "
+            "WHERE domain = ? AND name = ? ORDER BY id LIMIT 1",
+            (domain, name)
+        ).fetchone()
+        if row is None:
+            return False
+        source = self._from_row(row[1:])
+        source.update(updates)
+        conn.execute(
+            "UPDATE sources SET domain = ?, name = ?, url = ?, reliability = ?, bias = ?, "
+            "tone = ?, notes = ?, extra = ? WHERE id = ?",
+            self._to_row(domain, source) + (row[0],)
+        )
+        return True
+
+    def _remove(self, conn, domain, name):
+        if conn.execute("SELECT 1 FROM sources WHERE domain = ? LIMIT 1", (domain,)).fetchone() is None:
+            return False
+        conn.execute("DELETE FROM sources WHERE domain = ? AND name = ?", (domain, name))
+        return True
+
+    def load_all(self):
+        registry = {}
+        rows = self._connect().execute(
+            "SELECT domain, name, url, reliability, bias, tone, notes, extra FROM sources ORDER BY id"
+        )
+        for row in rows:
+            registry.setdefault(row[0], []).append(self._from_row(row[1:]))
+        return registry
+
+    def get_domain(self, domain):
+        rows = self._connect().execute(
+            "SELECT name, url, reliability, bias, tone, notes, extra FROM sources WHERE domain = ? ORDER BY id",
+            (domain,)
+        )
+        return [self._from_row(row) for row in rows]
+
+    def find_by_name(self, name):
+        rows = self._connect().execute(
+            "SELECT domain, name, url, reliability, bias, tone, notes, extra FROM sources WHERE name = ? ORDER BY id",
+            (name,)
+        )
+        return [(row[0], self._from_row(row[1:])) for row in rows]
+
+    def replace_all(self, data):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM sources")
+            for domain, sources in data.items():
+                for entry in sources:
+                    self._add(conn, domain, entry)
+            self._bump_version(conn)
+
+    def add_source(self, domain, entry):
+        conn = self._connect()
+        with conn:
+            self._add(conn, domain, entry)
+            self._bump_version(conn)
+        return True
+
+    def update_source(self, domain, name, updates):
+        conn = self._connect()
+        with conn:
+            changed = self._update(conn, domain, name, updates)
+            if changed:
+                self._bump_version(conn)
+        return changed
+
+    def remove_source(self, domain, name):
+        conn = self._connect()
+        with conn:
+            changed = self._remove(conn, domain, name)
+            if changed:
+                self._bump_version(conn)
+        return changed
+
+    def apply_changes(self, changes):
+        """
+        Applies a list of add/update/remove changes in one transaction.
+        Returns one bool per change.
+        """
+        conn = self._connect()
+        with conn:
+            results = [_apply_change(self, conn, change) for change in changes]
+            if any(results):
+                self._bump_version(conn)
+        return results
+
+    def version(self):
+        row = self._connect().execute("SELECT value FROM registry_meta WHERE key = 'version'").fetchone()
+        return ("sqlite", row[0])
+
+    def import_json(self, path):
+        self.replace_all(read_registry_json(path))
+
+    def export_json(self, path):
+        atomic_write_json(self.load_all(), path)
+
+def _apply_change(store, target, change):
+    """
+    Dispatches one change dict ({"op": "add" | "update" | "remove", "domain", "name", ...})
+    to the store's row helpers against target (a registry dict or a SQLite connection).
+    """
+    op = change["op"]
+    if op == "add":
+        return store._add(target, change["domain"], change["source"])
+    if op == "update":
+        return store._update(target, change["domain"], change["name"], change["updates"])
+    if op == "remove":
+        return store._remove(target, change["domain"], change["name"])
+    raise ValueError(f"Unknown registry change op: {op}")
+
+# 🔌 Backend Selection
+_stores = {}
+_stores_lock = threading.Lock()
+
+def get_registry_store(backend=None, path=None):
+    """
+    Returns the shared store for the configured backend.
+    REGISTRY_BACKEND selects "json" (default) or "sqlite"; REGISTRY_DB_PATH locates the SQLite file.
+    """
+    backend = backend or get_config_value("REGISTRY_BACKEND", "json")
+    if backend == "sqlite":
+        path = path or get_config_value("REGISTRY_DB_PATH", REGISTRY_DB_PATH)
+        factory = SqliteRegistryStore
+    elif backend == "json":
+        path = path or REGISTRY_PATH
+        factory = JsonRegistryStore
+    else:
+        raise ValueError(f"Unknown registry backend: {backend}")
+
+    key = (backend, path)
+    store = _stores.get(key)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(key)
+            if store is None:
+                store = factory(path)
+                _stores[key] = store
+    return store
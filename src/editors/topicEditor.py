@@ -2,52 +2,166 @@
 topicEditor.py — Manages topic_tree.json for classification and editorial routing
 
 Supports topic creation, keyword tuning, sensitivity tagging, and source cluster mapping.
+Readers share one immutable TopicTree snapshot; edits publish a fresh snapshot.
 Drafted collaboratively with Copilot and Bob Greenwade.
 """
 
+import copy
 import json
 import os
+import threading
+import time
+from types import MappingProxyType
+from editors.configEditor import atomic_write_json, locked_file
 
 TOPIC_TREE_PATH = "topic_tree.json"
 
-def load_topic_tree(path=TOPIC_TREE_PATH):
+# Seconds between stat() checks of topic_tree.json for edits made by other processes
+TOPIC_TREE_REVALIDATE_INTERVAL = 1.0
+
+class TopicTree:
+    """
+    Immutable snapshot of topic_tree.json with O(1) metadata lookups.
+    Derived artifacts (e.g. compiled matchers) are cached per snapshot via derive().
+    """
+
+    def __init__(self, data, stamp=None):
+        self.stamp = stamp
+        topics = {}
+        for topic, metadata in data.items():
+            frozen = dict(metadata)
+            frozen["keywords"] = tuple(metadata.get("keywords", []))
+            topics[topic] = MappingProxyType(frozen)
+        self._topics = MappingProxyType(topics)
+        self.clusters = MappingProxyType({t: m.get("source_cluster", "general") for t, m in data.items()})
+        self.sensitive = MappingProxyType({t: m.get("sensitive", False) for t, m in data.items()})
+        self.keyword_counts = MappingProxyType({t: len(m["keywords"]) for t, m in topics.items()})
+        self._derived = {}
+
+    def __contains__(self, topic):
+        return topic in self._topics
+
+    def __iter__(self):
+        return iter(self._topics)
+
+    def __len__(self):
+        return len(self._topics)
+
+    def get(self, topic, default=None):
+        return self._topics.get(topic, default)
+
+    def items(self):
+        return self._topics.items()
+
+    def source_cluster(self, topic):
+        return self.clusters.get(topic, "general")
+
+    def is_sensitive(self, topic):
+        return self.sensitive.get(topic, False)
+
+    def derive(self, name, builder):
+        """
+        Returns builder(self), computed once per snapshot and cached under name.
+        """
+        if name not in self._derived:
+            self._derived[name] = builder(self)
+        return self._derived[name]
+
+    def to_dict(self):
+        """
+        Returns a mutable deep copy in topic_tree.json format.
+        """
+        return {t: {**copy.deepcopy(dict(m)), "keywords": list(m["keywords"])} for t, m in self._topics.items()}
+
+# 🗂️ Snapshot Registry
+# path → (last checked, TopicTree); replaced whole on reload or publish
+_topic_snapshots = {}
+_topic_lock = threading.Lock()
+
+def _stat_topic_tree(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _read_topic_tree_file(path):
     if not os.path.exists(path):
         return {}
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
+def _publish_topic_tree(data, path):
+    tree = TopicTree(data, _stat_topic_tree(path))
+    _topic_snapshots[path] = (time.monotonic(), tree)
+    return tree
+
+def get_topic_tree(path=TOPIC_TREE_PATH):
+    """
+    Returns the shared TopicTree snapshot for path.
+    Parses the file once, then reloads only when its mtime or size changes.
+    """
+    entry = _topic_snapshots.get(path)
+    now = time.monotonic()
+    if entry is not None and now - entry[0] < TOPIC_TREE_REVALIDATE_INTERVAL:
+        return entry[1]
+
+    with _topic_lock:
+        entry = _topic_snapshots.get(path)
+        stamp = _stat_topic_tree(path)
+        if entry is not None and entry[1].stamp == stamp:
+            _topic_snapshots[path] = (now, entry[1])
+            return entry[1]
+        return _publish_topic_tree(_read_topic_tree_file(path) if stamp else {}, path)
+
+def load_topic_tree(path=TOPIC_TREE_PATH):
+    return get_topic_tree(path).to_dict()
+
 def save_topic_tree(data, path=TOPIC_TREE_PATH):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    with locked_file(path):
+        atomic_write_json(data, path)
+        _publish_topic_tree(data, path)
+
+def _edit_topic_tree(edit, path=TOPIC_TREE_PATH):
+    """
+    Applies edit(tree) to a fresh read of the file under the topic tree lock.
+    Writes and publishes only if edit returns True.
+    """
+    with locked_file(path):
+        tree = _read_topic_tree_file(path)
+        if not edit(tree):
+            return False
+        atomic_write_json(tree, path)
+        _publish_topic_tree(tree, path)
+        return True
 
 def add_topic(name, keywords, source_cluster="general", sensitive=False):
-    tree = load_topic_tree()
-    if name in tree:
-        return False
-    tree[name] = {
-        "keywords": keywords,
-        "source_cluster": source_cluster,
-        "sensitive": sensitive
-    }
-    save_topic_tree(tree)
-    return True
+    def edit(tree):
+        if name in tree:
+            return False
+        tree[name] = {
+            "keywords": keywords,
+            "source_cluster": source_cluster,
+            "sensitive": sensitive
+        }
+        return True
+    return _edit_topic_tree(edit)
 
 def update_topic(name, updates):
-    tree = load_topic_tree()
-    if name not in tree:
-        return False
-    tree[name].update(updates)
-    save_topic_tree(tree)
-    return True
+    def edit(tree):
+        if name not in tree:
+            return False
+        tree[name].update(updates)
+        return True
+    return _edit_topic_tree(edit)
 
 def remove_topic(name):
-    tree = load_topic_tree()
-    if name not in tree:
-        return False
-    del tree[name]
-    save_topic_tree(tree)
-    return True
+    def edit(tree):
+        if name not in tree:
+            return False
+        del tree[name]
+        return True
+    return _edit_topic_tree(edit)
 
 def list_topics():
-    tree = load_topic_tree()
-    return list(tree.keys())
+    return list(get_topic_tree())
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+factcheck.py — Command-line batch checker
+
+Runs files, directories, globs, or stdin through the batchCheck pipeline and
+writes responses as JSON (one record per document) or JSONL (one line per response).
+Progress is saved after every document, so an interrupted run can --resume.
+Ends with a throughput report: assertions/sec, documents/sec, and peak RSS.
+Drafted collaboratively with Copilot and Bob Greenwade.
+"""
+
+import argparse
+import fnmatch
+import glob
+import json
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None  # no peak RSS on Windows
+
+# Modules import their siblings by bare name, so put every source folder on the path
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [
+    path for path in (os.path.join(SRC_DIR, sub) for sub in ("", "logic", "classifiers", "editors"))
+    if path not in sys.path
+]
+
+from batchCheck import BatchStats, iter_process_batch, shutdown_process_pools
+from pipelineProfile import PipelineProfile
+from editors.configEditor import atomic_write_json
+
+DEFAULT_PATTERN = "*.txt"
+GLOB_CHARS = "*?["
+STDIN = "-"
+
+def expand_inputs(inputs, pattern=DEFAULT_PATTERN):
+    """
+    Resolves files, directories (searched recursively for pattern), and globs
+    into an ordered list of document paths. "-" or no inputs means stdin.
+    """
+    documents = []
+    seen = set()
+    for item in inputs or [STDIN]:
+        if item == STDIN or os.path.isfile(item):
+            candidates = [item]
+        elif os.path.isdir(item):
+            candidates = []
+            for root, dirs, files in os.walk(item):
+                dirs.sort()
+                candidates.extend(os.path.join(root, name) for name in sorted(files) if fnmatch.fnmatch(name, pattern))
+        elif any(ch in item for ch in GLOB_CHARS):
+            candidates = sorted(path for path in glob.glob(item, recursive=True) if os.path.isfile(path))
+        else:
+            raise FileNotFoundError(f"No such file, directory, or glob match: {item}")
+        for path in candidates:
+            if path not in seen:
+                seen.add(path)
+                documents.append(path)
+    return documents
+
+def peak_rss_mb(who=None):
+    """
+    Peak resident set size in MB for this process (or its children), None if unavailable.
+    """
+    if resource is None:
+        return None
+    usage = resource.getrusage(who if who is not None else resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return round(usage / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+# 💾 Resume State
+def load_state(path):
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            return json.load(f)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{path} is not valid JSON: {exc}")
+
+def new_state(args):
+    return {"format": args.format, "persona": args.persona, "completed": [], "written": 0, "offset": 0}
+
+def open_output(args, state):
+    """
+    Opens the output for writing. On resume, drops anything written after the
+    last completed document, so a half-written document is redone cleanly.
+    """
+    if not args.output:
+        return sys.stdout
+    if state["offset"]:
+        out = open(args.output, "r+", encoding="utf-8")
+        out.seek(state["offset"])
+        out.truncate()
+        return out
+    return open(args.output, "w", encoding="utf-8")
+
+def check_document(document, out, args, profile):
+    """
+    Checks one document and writes its records. Returns its BatchStats.
+    """
+    stats = BatchStats()
+    source = sys.stdin if document == STDIN else open(document, "r", encoding="utf-8", errors="replace")
+    try:
+        responses = iter_process_batch(source, args.persona, args.workers, stats, profile)
+        if args.format == "jsonl":
+            for response in responses:
+                out.write(json.dumps({"document": document, **response}, ensure_ascii=False) + "\n")
+        else:
+            record = {"document": document, "responses": list(responses), "dedup": stats.dedup()}
+            out.write(json.dumps(record, ensure_ascii=False))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    out.flush()
+    return stats
+
+def build_report(documents, skipped, assertions, elapsed, profile):
+    report = {
+        "documents": documents,
+        "skipped": skipped,
+        "assertions": assertions,
+        "elapsed_seconds": round(elapsed, 3),
+        "assertions_per_second": round(assertions / elapsed, 1) if elapsed else 0.0,
+        "documents_per_second": round(documents / elapsed, 2) if elapsed else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_rss_children_mb": peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else None
+    }
+    if profile is not None:
+        report["profile"] = profile.report()["stages"]
+    return report
+
+def prepare_run(args):
+    """
+    Resolves the inputs and loads the resume state before any document is checked.
+    Raises FileNotFoundError for a missing input or output, ValueError for unusable state.
+    Returns (documents, state, state_path).
+    """
+    documents = expand_inputs(args.inputs, args.pattern)
+    state_path = args.state or (args.output + ".progress.json" if args.output else None)
+
+    state = load_state(state_path) if args.resume else None
+    if state is None:
+        return documents, new_state(args), state_path
+    if not isinstance(state, dict) or any(key not in state for key in new_state(args)):
+        raise ValueError(f"{state_path} is not a factcheck progress file")
+    if state["format"] != args.format:
+        raise ValueError(f"{state_path} was written for --format {state['format']}")
+    if state["offset"] and not os.path.exists(args.output):
+        raise FileNotFoundError(f"Cannot resume: {args.output} no longer exists")
+    return documents, state, state_path
+
+def run(args, documents, state, state_path):
+    completed = set(state["completed"])
+
+    profile = PipelineProfile() if args.profile else None
+    out = open_output(args, state)
+    if args.format == "json" and not state["offset"]:
+        out.write('{"documents": [\n')
+
+    checked = skipped = assertions = 0
+    started = time.perf_counter()
+    try:
+        for document in documents:
+            if document in completed:
+                skipped += 1
+                continue
+            if args.format == "json" and state["written"]:
+                out.write(",\n")
+            stats = check_document(document, out, args, profile)
+            checked += 1
+            assertions += stats.count
+
+            if document != STDIN:
+                state["completed"].append(document)
+            state["written"] += 1
+            if out is not sys.stdout:
+                state["offset"] = out.tell()
+                atomic_write_json(state, state_path)
+            if args.verbose:
+                print(f"🧾 {document}: {stats.count} assertions", file=sys.stderr)
+
+        elapsed = time.perf_counter() - started
+        # Reap the workers first so their peak RSS shows up under RUSAGE_CHILDREN
+        shutdown_process_pools()
+        report = build_report(checked, skipped, assertions, elapsed, profile)
+        if args.format == "json":
+            out.write('\n], "report": ' + json.dumps(report) + "}\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        shutdown_process_pools()
+    return report
+
+def print_report(report):
+    rss = f"{report['peak_rss_mb']} MB" if report["peak_rss_mb"] is not None else "n/a"
+    print(
+        f"✅ {report['documents']} documents ({report['skipped']} skipped), {report['assertions']} assertions "
+        f"in {report['elapsed_seconds']}s — {report['assertions_per_second']} assertions/s, "
+        f"{report['documents_per_second']} documents/s, peak RSS {rss}",
+        file=sys.stderr
+    )
+    if "profile" in report:
+        print(json.dumps(report["profile"], indent=2), file=sys.stderr)
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="factcheck",
+        description="Fact-check text files, directories, globs, or stdin."
+    )
+    parser.add_argument("inputs", nargs="*", help="files, directories, or glob patterns; '-' or nothing reads stdin")
+    parser.add_argument("--persona", default="default", help="editorial persona for phrasing and source trust")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes per document (default: serial)")
+    parser.add_argument("--format", choices=("json", "jsonl"), default="jsonl", help="output format (default: jsonl)")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--pattern", default=DEFAULT_PATTERN, help=f"file name pattern inside directories (default: {DEFAULT_PATTERN})")
+    parser.add_argument("--resume", action="store_true", help="skip documents finished by an earlier run with the same --output")
+    parser.add_argument("--state", help="progress file (default: <output>.progress.json)")
+    parser.add_argument("--profile", action="store_true", help="report per-stage timings")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log each finished document")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.resume and not args.output:
+        parser.error("--resume needs --output")
+
+    # Only bad inputs or resume state are usage errors; failures mid-run keep their traceback
+    try:
+        documents, state, state_path = prepare_run(args)
+    except (FileNotFoundError, ValueError) as exc:
+        parser.error(str(exc))
+
+    try:
+        report = run(args, documents, state, state_path)
+    except KeyboardInterrupt:
+        print("⏸️ Interrupted — rerun with --resume to continue", file=sys.stderr)
+        return 130
+    print_report(report)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
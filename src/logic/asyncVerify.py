@@ -0,0 +1,314 @@
+"""
+asyncVerify.py — Concurrent verification for web-routed assertions
+
+verify_assertions_async keeps many external_web checks in flight at once:
+source pages are fetched through one pooled client with per-host concurrency
+limits, per-host rate limiting, timeouts, and retry with exponential backoff.
+Uses aiohttp when installed, otherwise urllib on a bounded thread pool.
+Non-web source types still go through verify_assertion, off the event loop.
+Drafted collaboratively with Copilot and Bob Greenwade.
+"""
+
+import asyncio
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from sourceSelector import select_best_source, rank_source_trust
+from checkFact import editorial_verdict, resolve_source_topic, verify_assertion, similarity_scorer
+from batchInvariant import run_deterministic_inference
+from verificationCache import get_verification_cache
+from editors.configEditor import get_config_value
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # falls back to urllib in worker threads
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_PER_HOST = 8
+DEFAULT_RATE_PER_HOST = 20.0  # requests per second; 0 disables rate limiting
+DEFAULT_FETCH_TIMEOUT = 10.0
+DEFAULT_FETCH_RETRIES = 3
+DEFAULT_FETCH_BACKOFF = 0.5
+MAX_FETCH_BYTES = 1 << 20
+
+# Statuses worth retrying; anything else non-2xx fails immediately
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class FetchError(Exception):
+    def __init__(self, url, reason, status=None):
+        super().__init__(f"{url}: {reason}")
+        self.url = url
+        self.status = status
+
+class TokenBucket:
+    """
+    Allows rate requests per second on average, with bursts up to capacity.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+class PooledFetcher:
+    """
+    Async page fetcher; use as an async context manager, and share it across calls.
+    Concurrent requests for the same URL share one fetch; once it finishes, the
+    next request fetches again, so failures are retried and bodies are not kept.
+    """
+
+    def __init__(self, max_connections=None, per_host=None, rate_per_host=None,
+                 timeout=None, retries=None, backoff=None):
+        self.max_connections = max_connections or get_config_value("WEB_FETCH_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)
+        self.per_host = per_host or get_config_value("WEB_FETCH_PER_HOST", DEFAULT_PER_HOST)
+        self.rate_per_host = rate_per_host if rate_per_host is not None else get_config_value("WEB_FETCH_RATE_PER_HOST", DEFAULT_RATE_PER_HOST)
+        self.timeout = timeout or get_config_value("WEB_FETCH_TIMEOUT", DEFAULT_FETCH_TIMEOUT)
+        self.retries = retries if retries is not None else get_config_value("WEB_FETCH_RETRIES", DEFAULT_FETCH_RETRIES)
+        self.backoff = backoff if backoff is not None else get_config_value("WEB_FETCH_BACKOFF", DEFAULT_FETCH_BACKOFF)
+        self._host_slots = {}
+        self._host_buckets = {}
+        self._inflight = {}
+        self._session = None
+        self._threads = None
+        self.stats = {"fetches": 0, "shared": 0, "retries": 0, "failures": 0, "bytes": 0}
+
+    async def __aenter__(self):
+        if aiohttp is not None:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.per_host)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        else:
+            self._threads = ThreadPoolExecutor(max_workers=self.max_connections, thread_name_prefix="fetch")
+        return self
+
+    async def __aexit__(self, *exc):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._threads is not None:
+            self._threads.shutdown(wait=False)
+            self._threads = None
+
+    def _host_limits(self, host):
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = self._host_slots[host] = asyncio.Semaphore(self.per_host)
+            if self.rate_per_host:
+                self._host_buckets[host] = TokenBucket(self.rate_per_host)
+        return slots, self._host_buckets.get(host)
+
+    async def fetch(self, url):
+        """
+        Returns the page body as text; raises FetchError once retries are exhausted.
+        """
+        task = self._inflight.get(url)
+        if task is None:
+            task = self._inflight[url] = asyncio.ensure_future(self._fetch_with_retries(url))
+            task.add_done_callback(lambda done: self._forget(url, done))
+        else:
+            self.stats["shared"] += 1
+        # Shielded so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    def _forget(self, url, task):
+        if self._inflight.get(url) is task:
+            del self._inflight[url]
+        if not task.cancelled():
+            task.exception()  # marks the error retrieved even if every caller was cancelled
+
+    async def _fetch_with_retries(self, url):
+        slots, bucket = self._host_limits(urlsplit(url).netloc)
+        for attempt in range(self.retries + 1):
+            try:
+                async with slots:
+                    if bucket is not None:
+                        await bucket.acquire()
+                    self.stats["fetches"] += 1
+                    text = await self._fetch_once(url)
+                self.stats["bytes"] += len(text)
+                return text
+            except FetchError as exc:
+                retryable = exc.status is None or exc.status in RETRY_STATUSES
+                if not retryable or attempt == self.retries:
+                    self.stats["failures"] += 1
+                    raise
+            self.stats["retries"] += 1
+            await asyncio.sleep(self.backoff * (2 ** attempt))
+
+    async def _fetch_once(self, url):
+        if self._session is not None:
+            try:
+                async with self._session.get(url) as response:
+                    if response.status >= 400:
+                        raise FetchError(url, f"HTTP {response.status}", response.status)
+                    body = await response.content.read(MAX_FETCH_BYTES)
+                    return body.decode(response.charset or "utf-8", errors="replace")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                raise FetchError(url, str(exc) or type(exc).__name__)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._threads, self._urllib_fetch, url)
+
+    def _urllib_fetch(self, url):
+        try:
+            with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                charset = response.headers.get_content_charset() or "utf-8"
+                return response.read(MAX_FETCH_BYTES).decode(charset, errors="replace")
+        except urllib.error.HTTPError as exc:
+            raise FetchError(url, f"HTTP {exc.code}", exc.code)
+        except (urllib.error.URLError, OSError) as exc:
+            raise FetchError(url, str(exc))
+
+# 🌐 Async Verification
+def _score_page(assertion, page_text, source, persona):
+    source_trust = rank_source_trust(source, persona)
+    score = run_deterministic_inference(similarity_scorer, (assertion, page_text))
+    return {"score": score, "source_trust": source_trust, **editorial_verdict(score, source_trust)}
+
+def _prepare_web_check(assertion, topic, persona, force_refresh):
+    """
+    Picks the source and looks up the cache, in a worker thread: both can hit
+    the registry store, the topic classifier, or SQLite.
+    Returns (topic, source, cache_key, cached verdict or None).
+    """
+    topic = resolve_source_topic(assertion, topic)
+    source = select_best_source(topic, persona)
+    if not source or not source.get("url"):
+        return topic, None, None, None
+    cache = get_verification_cache()
+    if cache is None:
+        return topic, source, None, None
+    key = cache.make_key(assertion, source, f"{persona}@web")
+    return topic, source, key, None if force_refresh else cache.get(key)
+
+def _score_and_store(assertion, page_text, source, persona, key):
+    checked = _score_page(assertion, page_text, source, persona)
+    if key is not None:
+        get_verification_cache().put(key, checked, source.get("name"))
+    return checked
+
+async def _verify_web(fetcher, assertion, topic, persona, force_refresh):
+    topic, source, key, cached = await asyncio.to_thread(_prepare_web_check, assertion, topic, persona, force_refresh)
+    if source is None:
+        return await asyncio.to_thread(verify_assertion, assertion, "external_web", persona, force_refresh, False, topic)
+    if cached is not None:
+        return {"result": cached["result"], "confidence": cached["confidence"]}
+
+    try:
+        page_text = await fetcher.fetch(source["url"])
+    except FetchError as exc:
+        return {"result": "uncertain", "confidence": 0.0, "error": str(exc)}
+
+    checked = await asyncio.to_thread(_score_and_store, assertion, page_text, source, persona, key)
+    return {"result": checked["result"], "confidence": checked["confidence"]}
+
+async def verify_assertions_async(items, persona="default", force_refresh=False, fetcher=None):
+    """
+    Verifies (assertion, source_type) or (assertion, source_type, topic) items
+    concurrently; returns verdicts in input order. topic (a name or classify_topic()
+    scores) picks the registry domain; without it the assertion is classified.
+    external_web assertions fetch their best source's page and score against its text.
+    Pass an open PooledFetcher to share its pool and limits across calls.
+    """
+    if fetcher is None:
+        async with PooledFetcher() as fetcher:
+            return await verify_assertions_async(items, persona, force_refresh, fetcher)
+
+    async def verify(assertion, source_type, topic=None):
+        if source_type == "external_web":
+            return await _verify_web(fetcher, assertion, topic, persona, force_refresh)
+        return await asyncio.to_thread(verify_assertion, assertion, source_type, persona, force_refresh, False, topic)
+
+    return await asyncio.gather(*(verify(*item) for item in items))
+
+def verify_assertions(items, persona="default", force_refresh=False):
+    """
+    Synchronous wrapper around verify_assertions_async.
+    """
+    return asyncio.run(verify_assertions_async(items, persona, force_refresh))
+
+# 🧪 Stand-In Source Server
+class StandInSourceServer:
+    """
+    Local HTTP server for exercising the fetch path without the network.
+    pages maps path → body; delay adds latency to every response;
+    fail_first makes each path return 503 that many times before succeeding.
+    """
+
+    def __init__(self, pages=None, delay=0.0, fail_first=0):
+        self.pages = dict(pages or {})
+        self.delay = delay
+        self.fail_first = fail_first
+        self.hits = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    count = server.hits[self.path] = server.hits.get(self.path, 0) + 1
+                if server.delay:
+                    time.sleep(server.delay)
+                if count <= server.fail_first:
+                    self.send_error(503)
+                    return
+                body = server.pages.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                data = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def url(self, path="/"):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}{path}"
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
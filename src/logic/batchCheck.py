@@ -3,62 +3,356 @@ batchCheck.py — Processes multiple assertions in sequence
 
 Runs full fact-check pipeline on multi-claim input and returns structured results.
 Now includes batch-level editorial consistency scoring via batchInvariant.py.
+Responses can be streamed one at a time or written incrementally as JSONL.
 Drafted collaboratively with Copilot and Bob Greenwade.
 """
 
-from segmentText import split_into_sentences, extract_assertions, tag_assertion_type
-from topicClassifier import classify_topic, route_to_source_cluster
-from sourceSelector import evaluate_source_viability, select_source_type
+import json
+import multiprocessing
+import threading
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from segmentText import extract_assertions, tag_assertion_type, iter_sentences, assertion_key
+from topicClassifier import classify_topics, get_compiled_topic_tree
+from sourceSelector import evaluate_source_viability, select_source_type, get_sources_for_topic
 from checkFact import verify_assertion, generate_fact_response
-from editorialPhrasing import phrase_confirmation, phrase_refutation, phrase_hedge
-from batchInvariant import summarize_batch_invariants
+from batchInvariant import DriftAccumulator
+from pipelineProfile import NULL_PROFILE, PipelineProfile
 
-def process_batch(text, persona="default", semantic_distance_fn=None):
+# Assertions classified together per classify_topics call while streaming
+CLASSIFY_BATCH_SIZE = 1024
+# Size of the first streaming batch; later batches double up to CLASSIFY_BATCH_SIZE
+FIRST_BATCH_SIZE = 16
+
+# Inputs shorter than this many sentences run serially; pool start-up would dominate
+PARALLEL_MIN_SENTENCES = 256
+# Sentences sent to a worker process per task
+SHARD_SENTENCES = 64
+# Verdicts remembered per run (serial) or per worker process; least recently used go first
+VERDICT_MEMO_LIMIT = 100000
+
+def _iter_batches(items, size, first_size=None):
     """
-    Processes a block of text through the full fact-check pipeline.
-    Returns list of structured editorial responses and batch-level summary.
+    Groups items into lists of size; with first_size, batches start
+    that small and double up to size, so the first results arrive sooner.
+    """
+    limit = first_size or size
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= limit:
+            yield batch
+            batch = []
+            limit = min(limit * 2, size)
+    if batch:
+        yield batch
+
+def evaluate_assertion(assertion, topic, profile=NULL_PROFILE):
+    """
+    Types and verifies one classified assertion.
+    Returns the verdict as (result, confidence, source_type).
+    """
+    with profile.stage("tag_assertion_type"):
+        assertion_type = tag_assertion_type(assertion)
+    if not evaluate_source_viability(assertion_type, topic):
+        return "uncertain", 0.0, "none"
+    with profile.stage("select_source_type"):
+        source_type = select_source_type(topic, assertion)
+    with profile.stage("verify_assertion"):
+        verification = verify_assertion(assertion, source_type, topic=topic)
+    return verification["result"], verification["confidence"], source_type
+
+def build_response(sentence_index, assertion, verdict, persona="default", profile=NULL_PROFILE):
     """
-    responses = []
-    assertions = []
-    sentences = split_into_sentences(text)
-
-    for sentence_index, sentence in enumerate(sentences):
-        extracted = extract_assertions(sentence)
-        for assertion in extracted:
-            assertions.append(assertion)
-            assertion_type = tag_assertion_type(assertion)
-            topic = classify_topic(assertion)
-            if not evaluate_source_viability(assertion_type, topic):
-                phrasing = phrase_hedge(assertion, confidence=0.0, persona=persona)
-                result = "uncertain"
-                confidence = 0.0
-                source_type = "none"
-            else:
-                source_type = select_source_type(topic, assertion)
-                verification = verify_assertion(assertion, source_type)
-                result = verification["result"]
-                confidence = verification["confidence"]
-                if result == "true":
-                    phrasing = phrase_confirmation(assertion, confidence, persona)
-                elif result == "false":
-                    phrasing = phrase_refutation(assertion, confidence, persona)
-                else:
-                    phrasing = phrase_hedge(assertion, confidence, persona)
-            responses.append({
-                "sentence_index": sentence_index,
-                "assertion": assertion,
-                "status": result if result in ["true", "false"] else "uncertain",
-                "confidence": round(confidence, 2),
-                "main_source": source_type,
-                "phrasing": phrasing
-            })
-
-    batch_summary = summarize_batch_invariants(responses, assertions, semantic_distance_fn) if semantic_distance_fn else None
+    Phrases a verdict for one occurrence of an assertion.
+    """
+    result, confidence, source_type = verdict
+    with profile.stage("phrasing"):
+        phrasing = generate_fact_response(assertion, result, confidence, persona)
+    return {
+        "sentence_index": sentence_index,
+        "assertion": assertion,
+        "status": result if result in ["true", "false"] else "uncertain",
+        "confidence": round(confidence, 2),
+        "main_source": source_type,
+        "phrasing": phrasing
+    }
+
+class VerdictMemo:
+    """
+    Bounded LRU of assertion_key → (result, confidence, source_type).
+    An evicted claim is simply verified again if it comes back.
+    """
+
+    def __init__(self, limit=VERDICT_MEMO_LIMIT):
+        self.limit = limit
+        self._verdicts = OrderedDict()
+
+    def __len__(self):
+        return len(self._verdicts)
 
+    def get(self, key):
+        verdict = self._verdicts.get(key)
+        if verdict is not None:
+            self._verdicts.move_to_end(key)
+        return verdict
+
+    def put(self, key, verdict):
+        self._verdicts[key] = verdict
+        self._verdicts.move_to_end(key)
+        while len(self._verdicts) > self.limit:
+            self._verdicts.popitem(last=False)
+
+    def clear(self):
+        self._verdicts.clear()
+
+def summarize_dedup(total, unique):
     return {
+        "assertions": total,
+        "unique": unique,
+        "duplicates": total - unique,
+        "dedup_ratio": round((total - unique) / total, 3) if total else 0.0
+    }
+
+def _check_batch(batch, verdicts, persona="default", profile=NULL_PROFILE):
+    """
+    Classifies and verifies the claims in batch not already in verdicts (a VerdictMemo),
+    then phrases every occurrence. Returns (assertion_key, response) pairs in batch order.
+    """
+    keys = [assertion_key(assertion) for _, assertion in batch]
+    # Held locally too, so the memo evicting mid-batch never loses a verdict this batch needs
+    batch_verdicts = {}
+    fresh = {}
+    for key, item in zip(keys, batch):
+        if key in batch_verdicts or key in fresh:
+            continue
+        verdict = verdicts.get(key)
+        if verdict is not None:
+            batch_verdicts[key] = verdict
+        else:
+            fresh[key] = item
+    with profile.stage("classify_topic", len(fresh)):
+        topics = classify_topics([assertion for _, assertion in fresh.values()])
+    for (key, (sentence_index, assertion)), topic in zip(fresh.items(), topics):
+        with profile.span(assertion, sentence_index):
+            batch_verdicts[key] = evaluate_assertion(assertion, topic, profile)
+        verdicts.put(key, batch_verdicts[key])
+
+    return [
+        (key, build_response(sentence_index, assertion, batch_verdicts[key], persona, profile))
+        for key, (sentence_index, assertion) in zip(keys, batch)
+    ]
+
+# ⚙️ Process Pool Workers
+# Verdicts cached per worker process, across the shards of one run; a new run starts
+# empty, so registry, topic tree, and config edits between runs are always seen
+_worker_verdicts = VerdictMemo()
+_worker_run_id = None
+
+def _init_worker():
+    """
+    Runs once per worker: loads the topic tree and source registry so shards start warm.
+    """
+    _worker_verdicts.clear()
+    get_compiled_topic_tree()
+    get_sources_for_topic(None)
+
+def _check_shard(shard, persona, run_id, profiled=False):
+    """
+    Returns the shard's (assertion_key, response) pairs and, if profiled, its PipelineProfile.
+    run_id identifies the _iter_parallel call the shard belongs to.
+    """
+    global _worker_run_id
+    if run_id != _worker_run_id:
+        _worker_verdicts.clear()
+        _worker_run_id = run_id
+    profile = PipelineProfile() if profiled else NULL_PROFILE
+    batch = list(_iter_extracted(shard, profile))
+    return _check_batch(batch, _worker_verdicts, persona, profile), (profile if profiled else None)
+
+# workers → shared pool, kept warm across documents
+_process_pools = {}
+_process_pools_lock = threading.Lock()
+
+def _get_process_pool(workers):
+    """
+    Returns the shared pool with this many workers, starting it on first use.
+    Workers are spawned rather than forked so they never inherit open SQLite connections or threads.
+    """
+    pool = _process_pools.get(workers)
+    if pool is None:
+        with _process_pools_lock:
+            pool = _process_pools.get(workers)
+            if pool is None:
+                context = multiprocessing.get_context("spawn")
+                pool = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker)
+                _process_pools[workers] = pool
+    return pool
+
+def shutdown_process_pools():
+    with _process_pools_lock:
+        pools = list(_process_pools.values())
+        _process_pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+def _iter_parallel(sentences, persona, workers, profile=NULL_PROFILE):
+    """
+    Checks (sentence_index, sentence) shards on a process pool, yielding results in input order.
+    At most two shards per worker are queued, so the input is still consumed as a stream.
+    """
+    pool = _get_process_pool(workers)
+    run_id = uuid.uuid4().hex
+    pending = deque()
+    for shard in _iter_batches(sentences, SHARD_SENTENCES):
+        pending.append(pool.submit(_check_shard, shard, persona, run_id, profile.enabled))
+        if len(pending) >= workers * 2:
+            results, shard_profile = pending.popleft().result()
+            profile.merge(shard_profile)
+            yield from results
+    while pending:
+        results, shard_profile = pending.popleft().result()
+        profile.merge(shard_profile)
+        yield from results
+
+def _iter_extracted(sentences, profile=NULL_PROFILE):
+    """
+    Yields (sentence_index, assertion) pairs from (sentence_index, sentence) pairs.
+    """
+    for sentence_index, sentence in sentences:
+        with profile.stage("assertion_extract"):
+            assertions = extract_assertions(sentence)
+        for assertion in assertions:
+            yield sentence_index, assertion
+
+def _iter_checked(text, persona="default", workers=None, profile=NULL_PROFILE):
+    """
+    Yields (assertion_key, response) pairs in sentence order, serially or on a process pool.
+    Sentence splitting is timed as "sentence_split" and extraction as "assertion_extract"
+    in every mode, so serial and parallel profiles line up.
+    """
+    sentences = enumerate(profile.timed_iter("sentence_split", iter_sentences(text)))
+    if workers and workers > 1:
+        head = list(islice(sentences, PARALLEL_MIN_SENTENCES))
+        if len(head) >= PARALLEL_MIN_SENTENCES:
+            yield from _iter_parallel(chain(head, sentences), persona, workers, profile)
+            return
+        sentences = head
+
+    verdicts = VerdictMemo()
+    for batch in _iter_batches(_iter_extracted(sentences, profile), CLASSIFY_BATCH_SIZE, FIRST_BATCH_SIZE):
+        yield from _check_batch(batch, verdicts, persona, profile)
+
+class BatchStats:
+    """
+    Running aggregates behind batch_summary and dedup, updated one response at a time,
+    so a batch can be summarized without retaining its responses.
+    Unique claims are counted exactly from 8-byte digests (the first 64 bits of each
+    assertion_key, kept as ints): 36 bytes each against 89 for the hex keys, and a
+    collision is unlikely below billions of unique claims (odds ≈ n² / 2⁶⁵).
+    Drift still compares every pair, so it keeps the assertion texts when requested.
+    """
+
+    def __init__(self, semantic_distance_fn=None):
+        self.drift = DriftAccumulator(semantic_distance_fn) if semantic_distance_fn else None
+        self.count = 0
+        self.digests = set()
+        self.statuses = set()
+        self.min_confidence = None
+        self.max_confidence = None
+
+    def add(self, key, response):
+        confidence = response["confidence"]
+        self.count += 1
+        self.digests.add(int(key[:16], 16))
+        self.statuses.add(response["status"])
+        if self.min_confidence is None or confidence < self.min_confidence:
+            self.min_confidence = confidence
+        if self.max_confidence is None or confidence > self.max_confidence:
+            self.max_confidence = confidence
+        if self.drift is not None:
+            self.drift.append(response["assertion"])
+
+    def batch_summary(self):
+        """
+        Same fields as summarize_batch_invariants; None when drift was not requested.
+        """
+        if self.drift is None:
+            return None
+        spread = self.max_confidence - self.min_confidence if self.count else 0.0
+        return {
+            "drift_score": self.drift.score(),
+            "confidence_consistent": spread < 0.3,
+            "verdict_harmonized": len(self.statuses) == 1
+        }
+
+    def dedup(self):
+        return summarize_dedup(self.count, len(self.digests))
+
+def iter_process_batch(text, persona="default", workers=None, stats=None, profile=None):
+    """
+    Yields each structured editorial response as soon as it is phrased, in sentence order.
+    Pass a BatchStats to collect the batch summary and dedup counts along the way,
+    and a PipelineProfile to time each pipeline stage.
+    Accepts the same text and workers arguments as process_batch.
+    """
+    for key, response in _iter_checked(text, persona, workers, profile or NULL_PROFILE):
+        if stats is not None:
+            stats.add(key, response)
+        yield response
+
+def process_batch(text, persona="default", semantic_distance_fn=None, workers=None, profile=False):
+    """
+    Processes a block of text through the full fact-check pipeline.
+    text may be a string, a text file object, or an iterable of text chunks;
+    it is segmented as a stream, so the input never has to be read whole.
+    Repeated claims (same normalized text) are classified and verified once,
+    and the verdict is phrased for every occurrence.
+    workers=N shards sentences across N processes; output matches the serial path,
+    and inputs under PARALLEL_MIN_SENTENCES sentences run serially.
+    Workers are spawned, so they re-import the calling script: a script using
+    workers > 1 must keep its top-level code under if __name__ == "__main__":,
+    or the pool fails with BrokenProcessPool.
+    profile=True adds per-stage timings and per-assertion spans under "profile".
+    Returns list of structured editorial responses and batch-level summary.
+    """
+    stats = BatchStats(semantic_distance_fn)
+    pipeline_profile = PipelineProfile() if profile else None
+    responses = list(iter_process_batch(text, persona, workers, stats, pipeline_profile))
+    result = {
         "responses": responses,
-        "batch_summary": batch_summary
+        "batch_summary": stats.batch_summary(),
+        "dedup": stats.dedup()
+    }
+    if pipeline_profile is not None:
+        result["profile"] = pipeline_profile.report()
+    return result
+
+def write_batch_jsonl(text, out, persona="default", semantic_distance_fn=None, workers=None, profile=False):
+    """
+    Streams responses to out (a path or text file object), one JSON object per line,
+    flushing each line so readers see verdicts as they are produced.
+    Returns the response count, batch summary, and dedup counts (plus profile, if requested).
+    """
+    if isinstance(out, str):
+        with open(out, "w", encoding="utf-8") as f:
+            return write_batch_jsonl(text, f, persona, semantic_distance_fn, workers, profile)
+
+    stats = BatchStats(semantic_distance_fn)
+    pipeline_profile = PipelineProfile() if profile else None
+    for response in iter_process_batch(text, persona, workers, stats, pipeline_profile):
+        out.write(json.dumps(response, ensure_ascii=False) + "\n")
+        out.flush()
+    result = {
+        "responses": stats.count,
+        "batch_summary": stats.batch_summary(),
+        "dedup": stats.dedup()
     }
+    if pipeline_profile is not None:
+        result["profile"] = pipeline_profile.report()
+    return result
 
 def summarize_results(responses):
     """
@@ -3,10 +3,35 @@ batchInvariant.py — Editorial consistency logic for batch-level operations
 
 Supports semantic drift scoring, verdict harmony, confidence spread analysis,
 and deterministic ML inference via batch-invariant ops.
+Drift can be computed exactly, vectorized over embeddings, sampled, or incrementally.
 Drafted collaboratively with Bob Greenwade and Copilot.
 """
 
-from batch_invariant_ops import set_batch_invariant_mode
+import hashlib
+import math
+import random
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+_numpy = None
+_numpy_checked = False
+
+def _load_numpy():
+    """
+    Imports NumPy the first time a drift helper needs it, so short runs skip its import cost.
+    Returns the module, or None when NumPy is not installed.
+    """
+    global _numpy, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = None  # drift helpers fall back to plain Python
+        _numpy_checked = True
+    return _numpy
 
 def score_batch_drift(assertions, semantic_distance_fn):
     """
@@ -20,6 +45,132 @@ def score_batch_drift(assertions, semantic_distance_fn):
             drift_scores.append(drift)
     return round(sum(drift_scores) / len(drift_scores), 3) if drift_scores else 0.0
 
+# 📐 Vectorized, Sampled, and Incremental Drift
+def _unit_vectors(embeddings):
+    """
+    Returns row-normalized embeddings; zero vectors stay zero (cosine distance 1.0 to everything).
+    """
+    np = _load_numpy()
+    if np is not None:
+        matrix = np.asarray(embeddings, dtype=np.float64)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+    units = []
+    for vector in embeddings:
+        norm = math.sqrt(sum(x * x for x in vector))
+        units.append([x / norm for x in vector] if norm else [0.0] * len(vector))
+    return units
+
+def _mean_cosine_distance(vector_sum, squared_norms, count):
+    """
+    Mean pairwise cosine distance from running sums of unit vectors:
+    the sum of u_i · u_j over i < j equals (|Σu|² − Σ|u|²) / 2.
+    """
+    pairs = count * (count - 1) / 2
+    if not pairs:
+        return 0.0
+    np = _load_numpy()
+    sum_norm_sq = float(np.dot(vector_sum, vector_sum)) if np is not None else sum(x * x for x in vector_sum)
+    return 1.0 - (sum_norm_sq - squared_norms) / 2 / pairs
+
+def score_batch_drift_vectorized(assertions=None, batch_distance_fn=None, embeddings=None):
+    """
+    Mean pairwise drift without per-pair Python calls.
+    Pass embeddings (one vector per assertion) for cosine distance in O(n · d),
+    or batch_distance_fn(assertions) returning an n × n distance matrix.
+    """
+    np = _load_numpy()
+    if embeddings is not None:
+        if len(embeddings) < 2:
+            return 0.0
+        units = _unit_vectors(embeddings)
+        if np is not None:
+            vector_sum = units.sum(axis=0)
+            squared_norms = float((units * units).sum())
+        else:
+            vector_sum = [sum(column) for column in zip(*units)]
+            squared_norms = sum(x * x for u in units for x in u)
+        return round(_mean_cosine_distance(vector_sum, squared_norms, len(units)), 3)
+
+    matrix = batch_distance_fn(assertions)
+    n = len(matrix)
+    if n < 2:
+        return 0.0
+    if np is not None:
+        upper = np.asarray(matrix, dtype=np.float64)[np.triu_indices(n, k=1)]
+        return round(float(upper.mean()), 3)
+    drift_scores = [matrix[i][j] for i in range(n) for j in range(i + 1, n)]
+    return round(sum(drift_scores) / len(drift_scores), 3)
+
+def drift_sample_size(max_error=0.02, confidence=0.95):
+    """
+    Pairs needed so the sampled mean is within max_error of the exact mean with the
+    given confidence, for distances in [0, 1] (Hoeffding's inequality).
+    """
+    return math.ceil(math.log(2 / (1 - confidence)) / (2 * max_error ** 2))
+
+def score_batch_drift_sampled(assertions, semantic_distance_fn, max_error=0.02, confidence=0.95, seed=None):
+    """
+    Estimates drift from uniformly sampled pairs instead of all n² / 2.
+    Falls back to the exact score when the batch has no more pairs than the sample needs.
+    """
+    n = len(assertions)
+    total_pairs = n * (n - 1) // 2
+    samples = drift_sample_size(max_error, confidence)
+    if samples >= total_pairs:
+        return score_batch_drift(assertions, semantic_distance_fn)
+
+    rng = random.Random(seed)
+    total = 0.0
+    for _ in range(samples):
+        i, j = rng.sample(range(n), 2)
+        total += semantic_distance_fn(assertions[i], assertions[j])
+    return round(total / samples, 3)
+
+class DriftAccumulator:
+    """
+    Running mean pairwise drift, updated as assertions are appended.
+    With semantic_distance_fn, each append costs one call per earlier assertion;
+    with embeddings (append(assertion, embedding=...)), each append costs O(d).
+    """
+
+    def __init__(self, semantic_distance_fn=None):
+        self.semantic_distance_fn = semantic_distance_fn
+        self.assertions = []
+        self.count = 0
+        self._distance_total = 0.0
+        self._vector_sum = None
+        self._squared_norms = 0.0
+
+    def append(self, assertion, embedding=None):
+        if self.semantic_distance_fn is not None:
+            for earlier in self.assertions:
+                self._distance_total += self.semantic_distance_fn(earlier, assertion)
+            self.assertions.append(assertion)
+        else:
+            np = _load_numpy()
+            unit = _unit_vectors([embedding])[0]
+            if self._vector_sum is None:
+                self._vector_sum = unit if np is not None else list(unit)
+            elif np is not None:
+                self._vector_sum = self._vector_sum + unit
+            else:
+                self._vector_sum = [a + b for a, b in zip(self._vector_sum, unit)]
+            self._squared_norms += float(sum(x * x for x in unit))
+        self.count += 1
+
+    def extend(self, assertions, embeddings=None):
+        for i, assertion in enumerate(assertions):
+            self.append(assertion, embeddings[i] if embeddings is not None else None)
+
+    def score(self):
+        if self.count < 2:
+            return 0.0
+        if self.semantic_distance_fn is not None:
+            pairs = self.count * (self.count - 1) / 2
+            return round(self._distance_total / pairs, 3)
+        return round(_mean_cosine_distance(self._vector_sum, self._squared_norms, self.count), 3)
+
 def score_confidence_consistency(responses):
     """
     Returns True if confidence spread is editorially consistent.
@@ -34,13 +185,199 @@ def score_verdict_harmony(responses):
     verdicts = set(r["status"] for r in responses)
     return len(verdicts) == 1
 
-def run_deterministic_inference(model, input_tensor):
+def _real_batch_invariant_mode(enabled=True):
+    from batch_invariant_ops import set_batch_invariant_mode  # heavy; deferred to first inference
+    return set_batch_invariant_mode(enabled)
+
+def run_deterministic_inference(model, input_tensor=None):
     """
     Runs model inference in batch-invariant mode.
+    When the shared InferenceExecutor is running, the call joins its next micro-batch.
     """
-    with set_batch_invariant_mode(True):
+    executor = _shared_executor
+    if executor is not None and not executor.closed:
+        return executor.submit(model, input_tensor).result()
+    with _real_batch_invariant_mode(True):
         return model(input_tensor)
 
+# ⚙️ Micro-Batching Inference Executor
+class InferenceExecutor:
+    """
+    Collects inference requests from many callers into micro-batches and runs each
+    batch inside one set_batch_invariant_mode(True) block.
+    A batch closes when it reaches max_batch_size or max_wait_ms after its first request.
+    Requests for the same model are passed together to model.predict_batch(inputs)
+    when the model has one; otherwise the model is called once per input.
+    Batch invariance keeps every result independent of which requests shared a batch.
+    """
+
+    def __init__(self, max_batch_size=32, max_wait_ms=5.0, mode_factory=None):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._mode_factory = mode_factory or _real_batch_invariant_mode
+        self._pending = []
+        self._condition = threading.Condition()
+        self._thread = None
+        self.closed = False
+        self.stats = {"requests": 0, "batches": 0, "largest_batch": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def submit(self, model, input_tensor=None):
+        """
+        Queues one inference request and returns a Future for its result.
+        """
+        future = Future()
+        with self._condition:
+            if self.closed:
+                raise RuntimeError("InferenceExecutor is shut down")
+            self._pending.append((model, input_tensor, future))
+            self.stats["requests"] += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="inference-executor", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def shutdown(self, wait=True):
+        """
+        Stops accepting requests; already queued requests still run.
+        """
+        with self._condition:
+            self.closed = True
+            self._condition.notify()
+            thread = self._thread
+        if wait and thread is not None:
+            thread.join()
+
+    def _next_batch(self):
+        with self._condition:
+            while not self._pending and not self.closed:
+                self._condition.wait()
+            if not self._pending:
+                return None
+            deadline = time.monotonic() + self.max_wait
+            while len(self._pending) < self.max_batch_size and not self.closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self.stats["batches"] += 1
+            self.stats["largest_batch"] = max(self.stats["largest_batch"], len(batch))
+            self._run_batch(batch)
+
+    def _run_batch(self, batch):
+        groups = {}
+        for model, input_tensor, future in batch:
+            if future.set_running_or_notify_cancel():
+                groups.setdefault(id(model), (model, []))[1].append((input_tensor, future))
+        try:
+            with self._mode_factory(True):
+                for model, requests in groups.values():
+                    predict_batch = getattr(model, "predict_batch", None)
+                    if predict_batch is not None:
+                        try:
+                            outputs = list(predict_batch([input_tensor for input_tensor, _ in requests]))
+                        except Exception as e:
+                            for _, future in requests:
+                                future.set_exception(e)
+                            continue
+                        if len(outputs) != len(requests):
+                            error = RuntimeError(
+                                f"predict_batch returned {len(outputs)} outputs for {len(requests)} inputs"
+                            )
+                            for _, future in requests:
+                                future.set_exception(error)
+                            continue
+                        for (_, future), output in zip(requests, outputs):
+                            future.set_result(output)
+                        continue
+                    for input_tensor, future in requests:
+                        try:
+                            future.set_result(model(input_tensor))
+                        except Exception as e:
+                            future.set_exception(e)
+        except Exception as e:
+            for _, requests in groups.values():
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(e)
+        finally:
+            # No caller may be left waiting on a future this batch never resolved
+            for _, requests in groups.values():
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(RuntimeError("Inference batch ended without a result"))
+
+_shared_executor = None
+_shared_executor_lock = threading.Lock()
+
+def start_inference_executor(max_batch_size=32, max_wait_ms=5.0, mode_factory=None):
+    """
+    Starts the shared executor; run_deterministic_inference routes through it until stopped.
+    """
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None or _shared_executor.closed:
+            _shared_executor = InferenceExecutor(max_batch_size, max_wait_ms, mode_factory)
+        return _shared_executor
+
+def stop_inference_executor(wait=True):
+    global _shared_executor
+    with _shared_executor_lock:
+        executor, _shared_executor = _shared_executor, None
+    if executor is not None:
+        executor.shutdown(wait)
+
+def submit_inference(model, input_tensor=None):
+    """
+    Queues a request on the shared executor (starting it if needed) and returns a Future.
+    """
+    return start_inference_executor().submit(model, input_tensor)
+
+# 🧪 Stand-ins for environments without batch_invariant_ops
+@contextmanager
+def stand_in_batch_invariant_mode(enabled=True):
+    """
+    No-op replacement for batch_invariant_ops.set_batch_invariant_mode.
+    """
+    yield
+
+class StandInModel:
+    """
+    Deterministic placeholder model: maps each input to a stable score in [0, 1].
+    predict_batch scores inputs independently, so results never depend on batch composition.
+    Records batch sizes for inspection.
+    """
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def _score(self, input_tensor):
+        digest = hashlib.sha256(repr(input_tensor).encode("utf-8")).hexdigest()
+        return round(int(digest[:8], 16) / 0xFFFFFFFF, 6)
+
+    def __call__(self, input_tensor):
+        self.batch_sizes.append(1)
+        return self._score(input_tensor)
+
+    def predict_batch(self, inputs):
+        self.batch_sizes.append(len(inputs))
+        return [self._score(input_tensor) for input_tensor in inputs]
+
 def summarize_batch_invariants(responses, assertions, semantic_distance_fn):
     """
     Returns a symbolic summary of batch-level editorial consistency.
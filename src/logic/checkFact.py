@@ -3,32 +3,46 @@ checkFact.py — Verifies individual assertions using editorial logic and ML inf
 
 Supports source-based verification, semantic similarity scoring, and editorial phrasing.
 Now includes batch-invariant inference and modular ML hooks.
+Verdicts are cached across runs via verificationCache.py; corroboration checks several sources in parallel.
 Drafted collaboratively with Copilot and Bob Greenwade.
 """
 
-from sourceSelector import select_best_source, rank_source_trust
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from sourceSelector import select_best_source, get_ranked_sources, rank_source_trust
+from topicClassifier import get_primary_topic, top_topic
 from editorialPhrasing import phrase_confirmation, phrase_refutation, phrase_hedge
 from batchInvariant import run_deterministic_inference
 from selectMachineLearning import ml_select_package
 from semantics import semantic_similarity_score  # hypothetical ML scoring function
+from verificationCache import get_verification_cache
+from editors.configEditor import get_config_value
 
-def verify_assertion(assertion, source_type, persona="default"):
+DEFAULT_CORROBORATION_TOP_K = 3
+DEFAULT_CORROBORATION_TIMEOUT = 5.0
+DEFAULT_CORROBORATION_WORKERS = 8
+
+class SimilarityScorer:
     """
-    Verifies an assertion using ML-based semantic similarity and source trust.
-    Returns result: true, false, or uncertain; plus confidence score.
+    Scores (assertion, source_text) pairs with semantic_similarity_score.
+    Shared by every caller, so the InferenceExecutor can put requests from
+    different assertions into one predict_batch call.
     """
-    source = select_best_source(assertion, persona)
-    if not source:
-        return {"result": "uncertain", "confidence": 0.0}
 
-    source_text = source.get("url") or source.get("notes") or ""
-    source_trust = rank_source_trust(source, persona)
+    def __call__(self, pair):
+        assertion, source_text = pair
+        return semantic_similarity_score(assertion, source_text)
 
-    # 🧠 Run semantic similarity in batch-invariant mode
-    score = run_deterministic_inference(
-        lambda x: semantic_similarity_score(assertion, source_text)
-    )
+    def predict_batch(self, pairs):
+        return [semantic_similarity_score(assertion, source_text) for assertion, source_text in pairs]
+
+similarity_scorer = SimilarityScorer()
 
+def editorial_verdict(score, source_trust):
+    """
+    Maps similarity score and source trust to a verdict and confidence.
+    """
     # 🧭 Editorial verdict logic
     if score > 0.85 and source_trust > 0.75:
         result = "true"
@@ -40,6 +54,151 @@ def verify_assertion(assertion, source_type, persona="default"):
     confidence = round((score + source_trust) / 2, 3)
     return {"result": result, "confidence": confidence}
 
+def score_source(assertion, source, persona="default", force_refresh=False):
+    """
+    Scores an assertion against one source, through the verification cache.
+    Returns the similarity score, source trust, verdict, and confidence.
+    """
+    cache = get_verification_cache()
+    key = cache.make_key(assertion, source, persona) if cache is not None else None
+    if cache is not None and not force_refresh:
+        cached = cache.get(key)
+        if cached is not None and "score" in cached:
+            return cached
+
+    source_text = source.get("url") or source.get("notes") or ""
+    source_trust = rank_source_trust(source, persona)
+
+    # 🧠 Run semantic similarity in batch-invariant mode
+    score = run_deterministic_inference(similarity_scorer, (assertion, source_text))
+    checked = {"score": score, "source_trust": source_trust, **editorial_verdict(score, source_trust)}
+    if cache is not None:
+        cache.put(key, checked, source.get("name"))
+    return checked
+
+def resolve_source_topic(assertion, topic=None):
+    """
+    Returns the registry domain to draw sources from: topic as given, the top
+    topic of a classify_topic() score dict, or the assertion's primary topic.
+    """
+    if isinstance(topic, dict):
+        return top_topic(topic)
+    return topic or get_primary_topic(assertion)
+
+def verify_assertion(assertion, source_type, persona="default", force_refresh=False, corroborate=False, topic=None):
+    """
+    Verifies an assertion using ML-based semantic similarity and source trust.
+    Returns result: true, false, or uncertain; plus confidence score.
+    Sources come from the registry under topic (a name or classify_topic() scores);
+    without one, the assertion is classified first.
+    Verdicts are served from the verification cache unless force_refresh is set.
+    corroborate=True (or a number of sources) checks the top-ranked sources in parallel instead.
+    """
+    topic = resolve_source_topic(assertion, topic)
+    if corroborate:
+        top_k = corroborate if corroborate is not True else None
+        return corroborate_assertion(assertion, source_type, persona, top_k=top_k, force_refresh=force_refresh, topic=topic)
+
+    source = select_best_source(topic, persona)
+    if not source:
+        return {"result": "uncertain", "confidence": 0.0}
+
+    checked = score_source(assertion, source, persona, force_refresh)
+    return {"result": checked["result"], "confidence": checked["confidence"]}
+
+# 🤝 Multi-Source Corroboration
+_corroboration_pool = None
+_corroboration_pool_lock = threading.Lock()
+
+def _get_corroboration_pool():
+    """
+    Returns the shared corroboration thread pool, sized by CORROBORATION_MAX_WORKERS.
+    """
+    global _corroboration_pool
+    if _corroboration_pool is None:
+        with _corroboration_pool_lock:
+            if _corroboration_pool is None:
+                workers = get_config_value("CORROBORATION_MAX_WORKERS", DEFAULT_CORROBORATION_WORKERS)
+                _corroboration_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="corroborate")
+    return _corroboration_pool
+
+def _timed_score(started, assertion, source, persona, force_refresh):
+    started[0] = time.monotonic()
+    return score_source(assertion, source, persona, force_refresh)
+
+def corroborate_assertion(assertion, source_type, persona="default", top_k=None, timeout=None, force_refresh=False, topic=None):
+    """
+    Checks the top_k ranked sources for topic concurrently and merges their similarity
+    scores, weighted by rank_source_trust. Each source gets timeout seconds from the
+    moment it starts on the shared pool, and may wait up to timeout for a free worker
+    first; sources that miss either deadline or fail are left out of the merge.
+    top_k is capped at CORROBORATION_MAX_WORKERS.
+    Returns the merged verdict, the source_type checked, and each source's contribution.
+    """
+    top_k = top_k or get_config_value("CORROBORATION_TOP_K", DEFAULT_CORROBORATION_TOP_K)
+    top_k = min(top_k, get_config_value("CORROBORATION_MAX_WORKERS", DEFAULT_CORROBORATION_WORKERS))
+    if timeout is None:
+        timeout = get_config_value("CORROBORATION_TIMEOUT", DEFAULT_CORROBORATION_TIMEOUT)
+
+    ranked = get_ranked_sources(resolve_source_topic(assertion, topic), persona)[:top_k]
+    if not ranked:
+        return {"result": "uncertain", "confidence": 0.0, "source_type": source_type, "contributions": []}
+
+    # Each task stamps its own start time, so a source queued behind another call's
+    # slow scorer is timed from when it actually runs, not from when it was submitted
+    pool = _get_corroboration_pool()
+    submitted = time.monotonic()
+    futures = {}
+    for source, trust in ranked:
+        started = [None]
+        future = pool.submit(_timed_score, started, assertion, source, persona, force_refresh)
+        futures[future] = (source, trust, started)
+
+    def deadline(future):
+        started = futures[future][2][0]
+        return (started if started is not None else submitted) + timeout
+
+    pending = set(futures)
+    timed_out = set()
+    while pending:
+        wait(pending, timeout=max(min(map(deadline, pending)) - time.monotonic(), 0), return_when=FIRST_COMPLETED)
+        now = time.monotonic()
+        expired = {future for future in pending if not future.done() and deadline(future) <= now}
+        timed_out |= expired
+        pending = {future for future in pending if not future.done()} - expired
+
+    contributions = []
+    weighted_score = 0.0
+    weighted_trust = 0.0
+    total_weight = 0.0
+    for future, (source, trust, started) in futures.items():
+        contribution = {"source": source.get("name"), "url": source.get("url"), "trust": trust}
+        if future in timed_out:
+            future.cancel()  # drops it from the queue if it never got a worker
+            contribution["status"] = "timeout"
+            contribution["started"] = started[0] is not None
+        elif future.exception() is not None:
+            contribution["status"] = "error"
+            contribution["error"] = str(future.exception())
+        else:
+            score = future.result()["score"]
+            contribution.update(status="ok", score=score)
+            weighted_score += trust * score
+            weighted_trust += trust * trust
+            total_weight += trust
+        contributions.append(contribution)
+
+    if not total_weight:
+        return {"result": "uncertain", "confidence": 0.0, "source_type": source_type, "contributions": contributions}
+
+    for contribution in contributions:
+        if contribution["status"] == "ok":
+            contribution["weight"] = round(contribution["trust"] / total_weight, 3)
+    merged = editorial_verdict(weighted_score / total_weight, weighted_trust / total_weight)
+    merged["source_type"] = source_type
+    merged["contributions"] = contributions
+    return merged
+
 def generate_fact_response(assertion, result, confidence, persona="default"):
     """
     Returns editorial phrasing based on result and confidence.
@@ -3,42 +3,151 @@ checkLogic.py — Evaluates logical structure and consistency of assertions
 
 Detects contradictions, fallacies, and rhetorical misdirection.
 Supports editorial tagging, sabotage scoring, and ML-enhanced logic analysis.
+Fallacy and misdirection rules are data-driven (logic_rules.json) and matched in one pass.
 Drafted collaboratively with Copilot and Bob Greenwade.
 """
 
+import json
+import os
 import re
 from selectMachineLearning import ml_select_package
 from batchInvariant import run_deterministic_inference
+from keywordMatcher import KeywordMatcher
+
+# Shipped rule set, found relative to this module so it loads from any working directory
+LOGIC_RULES_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "logic_rules.json")
+)
 
 # Optional ML hook for logic scoring
+class LogicConsistencyModel:
+    """
+    Placeholder logic model: replace with an actual model or scoring function.
+    One shared instance, so the InferenceExecutor can batch its requests.
+    """
+
+    def __call__(self, text):
+        return 0.75
+
+    def predict_batch(self, texts):
+        return [self(text) for text in texts]
+
+logic_consistency_model = LogicConsistencyModel()
+
 def score_logical_consistency(text):
     """
     Uses ML model to score logical consistency of the input.
-    Placeholder: replace with actual model or scoring function.
     """
     model = ml_select_package(task="classification")
-    return run_deterministic_inference(lambda x: 0.75)  # Replace with actual logic model
+    return run_deterministic_inference(logic_consistency_model, text)
+
+# 📚 Rule Engine
+# path → (file stamp, compiled rules); recompiled only when logic_rules.json changes
+_compiled_rules = {}
+
+def compile_logic_rules(rules):
+    """
+    Compiles every rule pattern, across all categories, into one automaton.
+    Each rule may list several patterns; it fires once if any of them appears.
+    """
+    pattern_rules = {}
+    outputs = {}
+    for category, category_rules in rules.items():
+        outputs[category] = []
+        for index, rule in enumerate(category_rules):
+            outputs[category].append({k: v for k, v in rule.items() if k != "patterns"})
+            for pattern in rule.get("patterns", []):
+                pattern_rules.setdefault(pattern.lower(), []).append((category, index))
+    return {
+        "matcher": KeywordMatcher(pattern_rules),
+        "pattern_rules": pattern_rules,
+        "outputs": outputs
+    }
+
+def load_logic_rules(path=LOGIC_RULES_PATH):
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Logic rules file not found: {path}")
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def get_logic_rules(path=LOGIC_RULES_PATH):
+    try:
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stamp = None
+    entry = _compiled_rules.get(path)
+    if entry is None or entry[0] != stamp:
+        entry = (stamp, compile_logic_rules(load_logic_rules(path)))
+        _compiled_rules[path] = entry
+    return entry[1]
+
+def match_logic_rules(text):
+    """
+    Finds every fallacy and misdirection rule hit in a single pass over the text.
+    Returns {category: [rule output, ...]} with rules in file order.
+    """
+    compiled = get_logic_rules()
+    fired = {category: set() for category in compiled["outputs"]}
+    for pattern in compiled["matcher"].find_all(text.lower()):
+        for category, index in compiled["pattern_rules"][pattern]:
+            fired[category].add(index)
+    return {
+        category: [dict(compiled["outputs"][category][i]) for i in sorted(indexes)]
+        for category, indexes in fired.items()
+    }
 
 def detect_fallacies(text):
-    fallacies = []
-    lowered = text.lower()
+    return match_logic_rules(text).get("fallacies", [])
+
+class KnownFacts:
+    """
+    Prebuilt index over known facts for detect_contradictions.
+    Facts and their "not ..." negations share one automaton, so each lookup
+    costs time proportional to the text rather than to the number of facts.
+    """
+
+    def __init__(self, facts):
+        self.facts = list(facts)
+        self._indexes = {}  # lowered fact → positions in self.facts (duplicates kept)
+        for i, fact in enumerate(self.facts):
+            self._indexes.setdefault(fact.lower(), []).append(i)
+        self._negations = {"not " + fact_lower: fact_lower for fact_lower in self._indexes}
+        self._matcher = KeywordMatcher(list(self._indexes) + list(self._negations))
+
+    def __len__(self):
+        return len(self.facts)
 
-    if "everyone knows" in lowered:
-        fallacies.append({
-            "type": "Appeal to Popularity",
-            "explanation": "Claim relies on consensus rather than evidence.",
-            "weight": 0.6
-        })
-    if "if we don't act now" in lowered:
-        fallacies.append({
-            "type": "False Dilemma",
-            "explanation": "Presents only two options when more exist.",
-            "weight": 0.7
-        })
-
-    return fallacies
+    def __iter__(self):
+        return iter(self.facts)
+
+    def contradictions(self, text):
+        """
+        Same result as detect_contradictions(text, list_of_facts):
+        a fact is contradicted when its negation appears and the bare fact does not.
+        """
+        found = self._matcher.find_all(text.lower())
+        positions = []
+        for pattern in found:
+            fact_lower = self._negations.get(pattern)
+            if fact_lower is not None and fact_lower not in found:
+                positions.extend(self._indexes[fact_lower])
+        return [
+            {
+                "fact": self.facts[i],
+                "explanation": "Contradicts known fact.",
+                "severity": 0.8
+            }
+            for i in sorted(positions)
+        ]
 
 def detect_contradictions(text, known_facts):
+    """
+    known_facts may be a list of fact strings or a prebuilt KnownFacts index.
+    """
+    if isinstance(known_facts, KnownFacts):
+        return known_facts.contradictions(text)
+
     contradictions = []
     lowered = text.lower()
 
@@ -56,29 +165,14 @@ def detect_contradictions(text, known_facts):
     return contradictions
 
 def tag_rhetorical_misdirection(text):
-    tags = []
-    lowered = text.lower()
-
-    if "clearly" in lowered:
-        tags.append({
-            "type": "Loaded Language",
-            "explanation": "Implies certainty without justification.",
-            "sabotage_score": 0.5
-        })
-    if "some say" in lowered:
-        tags.append({
-            "type": "Vague Attribution",
-            "explanation": "Avoids source responsibility.",
-            "sabotage_score": 0.4
-        })
-
-    return tags
+    return match_logic_rules(text).get("rhetorical_misdirection", [])
 
 def evaluate_logic(text, known_facts=None):
     known_facts = known_facts or []
+    rule_hits = match_logic_rules(text)
     return {
-        "fallacies": detect_fallacies(text),
+        "fallacies": rule_hits.get("fallacies", []),
         "contradictions": detect_contradictions(text, known_facts),
-        "rhetorical_tags": tag_rhetorical_misdirection(text),
+        "rhetorical_tags": rule_hits.get("rhetorical_misdirection", []),
         "logic_score": score_logical_consistency(text)
     }
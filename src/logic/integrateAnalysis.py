@@ -12,7 +12,7 @@ from editorialPhrasing import phrase_by_score
 from topicClassifier import classify_topic, flag_sensitive_topic
 from sourceSelector import select_best_source
 from selectMachineLearning import select_best_package
-from configEditor import get_config_value
+from editors.configEditor import get_config_value
 
 def integrate_text_analysis(assertion, known_facts=None, persona="default"):
     """
@@ -0,0 +1,217 @@
+"""
+pipelineProfile.py — Opt-in timing for fact-check pipeline stages
+
+Records wall time and call counts per stage in log-bucketed histograms
+(mergeable across worker processes, with p50/p95/p99), plus a bounded list of
+per-assertion trace spans. NULL_PROFILE is the disabled stand-in: its stage()
+hands back one shared no-op context, so uninstrumented runs pay almost nothing.
+Drafted collaboratively with Copilot and Bob Greenwade.
+"""
+
+import math
+import time
+
+# Histogram buckets per doubling of duration (~19% wide)
+BUCKETS_PER_OCTAVE = 4
+DEFAULT_MAX_SPANS = 1000
+
+class StageHistogram:
+    """
+    Log-bucketed durations (nanoseconds) for one stage.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.items = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.buckets = {}
+
+    def record(self, elapsed_ns, items=1):
+        self.calls += 1
+        self.items += items
+        self.total_ns += elapsed_ns
+        if self.min_ns is None or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        bucket = int(math.log2(elapsed_ns) * BUCKETS_PER_OCTAVE) if elapsed_ns > 0 else -1
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def merge(self, other):
+        self.calls += other.calls
+        self.items += other.items
+        self.total_ns += other.total_ns
+        if other.min_ns is not None and (self.min_ns is None or other.min_ns < self.min_ns):
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+
+    def percentile(self, q):
+        """
+        Approximate q-th percentile in nanoseconds (bucket midpoint, clamped to min/max).
+        """
+        if not self.calls:
+            return 0
+        rank = q / 100 * self.calls
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                estimate = 0 if bucket < 0 else 2 ** ((bucket + 0.5) / BUCKETS_PER_OCTAVE)
+                return min(max(estimate, self.min_ns), self.max_ns)
+        return self.max_ns
+
+    def report(self):
+        to_ms = lambda ns: round(ns / 1e6, 4)
+        return {
+            "calls": self.calls,
+            "items": self.items,
+            "total_ms": to_ms(self.total_ns),
+            "mean_ms": to_ms(self.total_ns / self.calls) if self.calls else 0.0,
+            "p50_ms": to_ms(self.percentile(50)),
+            "p95_ms": to_ms(self.percentile(95)),
+            "p99_ms": to_ms(self.percentile(99)),
+            "max_ms": to_ms(self.max_ns)
+        }
+
+class _Stage:
+    __slots__ = ("profile", "name", "items", "started")
+
+    def __init__(self, profile, name, items):
+        self.profile = profile
+        self.name = name
+        self.items = items
+
+    def __enter__(self):
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profile.record(self.name, time.perf_counter_ns() - self.started, self.items)
+
+class _Span:
+    __slots__ = ("profile", "trace", "started")
+
+    def __init__(self, profile, trace):
+        self.profile = profile
+        self.trace = trace
+
+    def __enter__(self):
+        self.profile._current_span = self.trace
+        self.started = time.perf_counter_ns()
+        return self.trace
+
+    def __exit__(self, *exc):
+        if self.trace is not None:
+            self.trace["total_ms"] = round((time.perf_counter_ns() - self.started) / 1e6, 4)
+        self.profile._current_span = None
+
+class PipelineProfile:
+    """
+    Per-stage histograms plus up to max_spans per-assertion traces.
+    Meant for one thread; profiles from worker processes combine with merge().
+    """
+    enabled = True
+
+    def __init__(self, max_spans=DEFAULT_MAX_SPANS):
+        self.max_spans = max_spans
+        self.stages = {}
+        self.spans = []
+        self.spans_dropped = 0
+        self._current_span = None
+
+    def record(self, name, elapsed_ns, items=1):
+        histogram = self.stages.get(name)
+        if histogram is None:
+            histogram = self.stages[name] = StageHistogram()
+        histogram.record(elapsed_ns, items)
+        if self._current_span is not None:
+            stages = self._current_span["stages"]
+            stages[name] = round(stages.get(name, 0.0) + elapsed_ns / 1e6, 4)
+
+    def stage(self, name, items=1):
+        """
+        Context manager timing one call of stage name (covering items inputs).
+        """
+        return _Stage(self, name, items)
+
+    def span(self, assertion, sentence_index=None):
+        """
+        Context manager tracing the stages run for one assertion.
+        Past max_spans, stages are still timed but no trace is kept.
+        """
+        if len(self.spans) >= self.max_spans:
+            self.spans_dropped += 1
+            return _Span(self, None)
+        trace = {"sentence_index": sentence_index, "assertion": assertion, "stages": {}}
+        self.spans.append(trace)
+        return _Span(self, trace)
+
+    def timed_iter(self, name, iterable):
+        """
+        Yields from iterable, timing each step under stage name.
+        """
+        iterator = iter(iterable)
+        while True:
+            started = time.perf_counter_ns()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.record(name, time.perf_counter_ns() - started, 0)
+                return
+            self.record(name, time.perf_counter_ns() - started)
+            yield item
+
+    def merge(self, other):
+        for name, histogram in other.stages.items():
+            self.stages.setdefault(name, StageHistogram()).merge(histogram)
+        room = max(self.max_spans - len(self.spans), 0)
+        self.spans.extend(other.spans[:room])
+        self.spans_dropped += other.spans_dropped + max(len(other.spans) - room, 0)
+
+    def report(self):
+        return {
+            "stages": {name: histogram.report() for name, histogram in self.stages.items()},
+            "spans": self.spans,
+            "spans_dropped": self.spans_dropped
+        }
+
+class _NullContext:
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_CONTEXT = _NullContext()
+
+class NullProfile:
+    """
+    Disabled profile: every hook is a no-op.
+    """
+    enabled = False
+
+    def record(self, name, elapsed_ns, items=1):
+        pass
+
+    def stage(self, name, items=1):
+        return _NULL_CONTEXT
+
+    def span(self, assertion, sentence_index=None):
+        return _NULL_CONTEXT
+
+    def timed_iter(self, name, iterable):
+        return iterable
+
+    def merge(self, other):
+        pass
+
+    def report(self):
+        return None
+
+NULL_PROFILE = NullProfile()
@@ -6,27 +6,188 @@ Now includes ML-ready assertion typing and expansion hooks.
 Drafted collaboratively with Copilot and Bob Greenwade.
 """
 
+import hashlib
 import re
-import nltk
-from nltk.tokenize import sent_tokenize
-from batchInvariant import run_deterministic_inference
-from selectMachineLearning import ml_select_package
+from functools import lru_cache
+from editors.configEditor import get_config_value
 
-nltk.download("punkt", quiet=True)
+# 🔤 Sentence Tokenizer (lazy, offline)
+# None until first use; then the punkt tokenize callable, or False if punkt is unavailable
+_sentence_tokenizer = None
 
-def split_into_sentences(text):
+def load_sentence_tokenizer():
     """
-    Splits input text into discrete sentences using NLTK.
-    Handles punctuation, conjunctions, and run-ons.
+    Resolves NLTK's punkt tokenizer from local data only: NLTK_DATA_PATH in config,
+    then NLTK's default search paths. Never downloads.
+    Returns a tokenize(text) callable, or None if NLTK or punkt is unavailable.
     """
-    return sent_tokenize(text)
+    global _sentence_tokenizer
+    if _sentence_tokenizer is None:
+        _sentence_tokenizer = _find_punkt() or False
+    return _sentence_tokenizer or None
+
+def reset_sentence_tokenizer():
+    """
+    Forgets the resolved tokenizer, e.g. after NLTK_DATA_PATH changes.
+    """
+    global _sentence_tokenizer
+    _sentence_tokenizer = None
+
+def _find_punkt():
+    try:
+        import nltk
+        from nltk.tokenize import sent_tokenize
+    except ImportError:
+        return None
+    data_path = get_config_value("NLTK_DATA_PATH")
+    if data_path and data_path not in nltk.data.path:
+        nltk.data.path.insert(0, data_path)
+    try:
+        sent_tokenize("Probe sentence. Another one.")
+    except LookupError:
+        return None
+    return sent_tokenize
+
+# ⚡ Fast Rule-Based Splitter
+# Abbreviations whose trailing period does not end a sentence
+ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "mt", "ft", "vs", "etc", "e.g", "i.e",
+    "inc", "ltd", "co", "corp", "dept", "gov", "gen", "sen", "rep", "rev", "approx",
+    "jan", "feb", "mar", "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec",
+    "u.s", "u.k", "a.m", "p.m"
+}
+# Also ordinary words, so abbreviations only before a number ("No. 5", "Fig. 2")
+NUMBER_ABBREVIATIONS = {"no", "fig"}
+# Capitalized words that usually open a sentence rather than follow an initial
+SENTENCE_STARTERS = {
+    "a", "an", "the", "this", "that", "these", "those", "it", "its", "he", "she", "they",
+    "we", "i", "you", "there", "here", "next", "then", "but", "and", "or", "so", "yet",
+    "in", "on", "at", "for", "if", "when", "while", "after", "before", "however", "also",
+    "my", "our", "his", "her", "their", "what", "who", "why", "how", "where", "which",
+    "no", "yes", "not", "all", "some", "many", "most", "one", "first", "finally", "as",
+    "to", "of", "with", "from", "by", "is", "was", "are", "were", "do", "does", "did",
+    "can", "will", "would", "should", "could", "let", "now", "today", "still"
+}
+_SENTENCE_END = re.compile(r"""[.!?]+["')\]]*(?=\s+["'(\[]?[A-Z0-9])""")
+_LAST_TOKEN = re.compile(r"""(\S+)\.["')\]]*$""")
+_NEXT_TOKEN = re.compile(r"""\s*["'(\[]?([^\s"')\]]+)""")
+
+def _looks_like_name(word):
+    """
+    True for a capitalized word that could be a surname, or another initial ("R.").
+    """
+    bare = word.rstrip(".,;:")
+    if len(bare) == 1:
+        return bare.isupper()
+    return bare[:1].isupper() and bare.isalpha() and bare.lower() not in SENTENCE_STARTERS
+
+def _ends_with_abbreviation(candidate, following=""):
+    match = _LAST_TOKEN.search(candidate)
+    if not match:
+        return False
+    token = match.group(1).lstrip("\"'([").lower()
+    nxt = _NEXT_TOKEN.match(following)
+    next_word = nxt.group(1) if nxt else ""
+    if token in NUMBER_ABBREVIATIONS:
+        return next_word[:1].isdigit()
+    if token in ABBREVIATIONS:
+        return True
+    # Single letters are initials ("J. Smith") only when a name follows ("plan A. Next" ends)
+    return len(token) == 1 and token.isalpha() and _looks_like_name(next_word)
+
+def fast_split_sentences(text):
+    """
+    Splits text at ., ! or ? followed by whitespace and a capitalized word, digit, or quote.
+    Skips common abbreviations, "No."/"Fig." before a number, and initials before a name.
+    No external resources needed.
+    """
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        end = match.end()
+        candidate = text[start:end]
+        if candidate.rstrip("\"')]").endswith(".") and _ends_with_abbreviation(candidate, text[end:end + 64]):
+            continue
+        sentence = candidate.strip()
+        if sentence:
+            sentences.append(sentence)
+        start = end
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(tail)
+    return sentences
+
+def split_into_sentences(text, mode=None):
+    """
+    Splits input text into discrete sentences.
+    Uses NLTK punkt when installed locally; falls back to fast_split_sentences
+    when punkt is unavailable or SEGMENTATION_MODE is "fast".
+    """
+    mode = mode or get_config_value("SEGMENTATION_MODE", "punkt")
+    tokenizer = load_sentence_tokenizer() if mode != "fast" else None
+    if tokenizer is None:
+        return fast_split_sentences(text)
+    return tokenizer(text)
+
+# 🌊 Streaming Segmentation
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def _iter_chunks(source, chunk_size):
+    if isinstance(source, str):
+        yield source
+        return
+    read = getattr(source, "read", None)
+    if read is None:
+        yield from source
+        return
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def iter_sentences(source, mode=None, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Lazily yields sentences from a string, a text file object, or an iterable of text chunks.
+    The last two sentences of each buffer are held back until more text arrives, so a
+    sentence split across chunks comes out whole, and the boundary before it is decided
+    with the next word complete. Memory is bounded by the longest pair of sentences.
+    """
+    carry = ""
+    for chunk in _iter_chunks(source, chunk_size):
+        buffer = carry + chunk
+        sentences = split_into_sentences(buffer, mode)
+        if len(sentences) < 2:
+            carry = buffer
+            continue
+        carry = buffer[buffer.rfind(sentences[-2], 0, buffer.rfind(sentences[-1])):]
+        yield from sentences[:-2]
+    if carry.strip():
+        yield from split_into_sentences(carry, mode)
+
+def iter_assertions(source, mode=None, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Lazily yields (sentence_index, assertion) pairs from any source iter_sentences accepts.
+    """
+    for sentence_index, sentence in enumerate(iter_sentences(source, mode, chunk_size)):
+        for assertion in extract_assertions(sentence):
+            yield sentence_index, assertion
+
+# 🧩 Compiled Assertion Patterns
+_CLAUSE_SPLIT = re.compile(r"\b(?:and|but|or|so|because|although|while|however)\b", re.IGNORECASE)
+_COMPOUND_SUBJECT = re.compile(r"(.+?) and (.+?) (are|were|will be|seem to be) (.+)", re.IGNORECASE)
+
+SPECULATIVE_KEYWORDS = ("might", "could", "possibly", "maybe", "i think", "it seems")
+OPINION_KEYWORDS = ("i believe", "in my opinion", "i feel", "should", "ought")
+# No question keyword is a prefix of another, so at most one can start an assertion
+QUESTION_KEYWORDS = ("who", "what", "why", "how", "when", "where")
 
 def extract_assertions(sentence):
     """
     Extracts individual assertions from compound sentence.
     Expands compound subjects into separate claims.
     """
-    parts = re.split(r"\b(?:and|but|or|so|because|although|while|however)\b", sentence, flags=re.IGNORECASE)
+    parts = _CLAUSE_SPLIT.split(sentence)
     assertions = [p.strip() for p in parts if len(p.strip()) > 5]
 
     expanded = []
@@ -34,49 +195,102 @@ def extract_assertions(sentence):
         expanded.extend(expand_entity_assertions(a))
     return expanded
 
-def tag_assertion_type(assertion):
+def _count_assertion_cues(lowered):
     """
-    Tags assertion as factual, speculative, opinion, or question.
-    Uses keyword heuristics; future upgrade to ML classifier.
+    Counts speculative, opinion, and question cues in one lowered assertion.
     """
-    speculative_keywords = ["might", "could", "possibly", "maybe", "i think", "it seems"]
-    opinion_keywords = ["i believe", "in my opinion", "i feel", "should", "ought"]
-    question_keywords = ["who", "what", "why", "how", "when", "where"]
+    speculative = 0
+    for kw in SPECULATIVE_KEYWORDS:
+        if kw in lowered:
+            speculative += 1
+    opinion = 0
+    for kw in OPINION_KEYWORDS:
+        if kw in lowered:
+            opinion += 1
+    if lowered.endswith("?"):
+        question = len(QUESTION_KEYWORDS)
+    else:
+        question = 1 if lowered.startswith(QUESTION_KEYWORDS) else 0
+    return speculative, opinion, question
 
-    lowered = assertion.lower()
+@lru_cache(maxsize=None)
+def _score_assertion_cues(speculative, opinion, question):
+    """
+    Replays the per-keyword score arithmetic for the given cue counts,
+    so floating-point rounding matches keyword-by-keyword scoring exactly.
+    """
     scores = {
         "factual": 0.85,
         "speculative": 0.0,
         "opinion": 0.0,
         "question": 0.0
     }
-
-    for kw in speculative_keywords:
-        if kw in lowered:
-            scores["speculative"] += 0.2
-            scores["factual"] -= 0.1
-    for kw in opinion_keywords:
-        if kw in lowered:
-            scores["opinion"] += 0.2
-            scores["factual"] -= 0.1
-    for kw in question_keywords:
-        if lowered.startswith(kw) or lowered.endswith("?"):
-            scores["question"] += 0.5
-            scores["factual"] -= 0.2
+    for _ in range(speculative):
+        scores["speculative"] += 0.2
+        scores["factual"] -= 0.1
+    for _ in range(opinion):
+        scores["opinion"] += 0.2
+        scores["factual"] -= 0.1
+    for _ in range(question):
+        scores["question"] += 0.5
+        scores["factual"] -= 0.2
 
     best_type = max(scores, key=scores.get)
+    return best_type, tuple((k, round(v, 2)) for k, v in scores.items())
+
+def tag_assertion_type(assertion):
+    """
+    Tags assertion as factual, speculative, opinion, or question.
+    Uses keyword heuristics; future upgrade to ML classifier.
+    """
+    best_type, scores = _score_assertion_cues(*_count_assertion_cues(assertion.lower()))
     return {
         "type": best_type,
-        "scores": {k: round(v, 2) for k, v in scores.items()}
+        "scores": dict(scores)
     }
 
+def tag_assertion_types(assertions):
+    """
+    Batch version of tag_assertion_type.
+    Repeated assertions within the batch are scored once.
+    """
+    scored = {}
+    results = []
+    for assertion in assertions:
+        lowered = assertion.lower()
+        cached = scored.get(lowered)
+        if cached is None:
+            cached = scored[lowered] = _score_assertion_cues(*_count_assertion_cues(lowered))
+        results.append({"type": cached[0], "scores": dict(cached[1])})
+    return results
+
+# 🔑 Assertion Identity
+_NON_WORD = re.compile(r"[^\w\s]+")
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_assertion(assertion):
+    """
+    Canonical form for spotting repeated claims: lower-cased, punctuation
+    replaced by spaces, whitespace collapsed. A trailing question mark is kept,
+    since it changes how the assertion is typed.
+    """
+    lowered = assertion.lower().strip()
+    normalized = _WHITESPACE.sub(" ", _NON_WORD.sub(" ", lowered)).strip()
+    return normalized + "?" if lowered.endswith("?") else normalized
+
+def assertion_key(assertion):
+    """
+    Content hash of the normalized assertion.
+    """
+    return hashlib.sha1(normalize_assertion(assertion).encode("utf-8")).hexdigest()
+
 def expand_entity_assertions(assertion):
     """
     Expands assertions with compound subjects into individual claims.
     Example: 'Charles and Camilla are reptiles' → ['Charles is a reptile', 'Camilla is a reptile']
     Placeholder logic; refine with NLP parser or dependency tree.
     """
-    match = re.match(r"(.+?) and (.+?) (are|were|will be|seem to be) (.+)", assertion, re.IGNORECASE)
+    match = _COMPOUND_SUBJECT.match(assertion)
     if match:
         subj1, subj2, verb, predicate = match.groups()
         return [f"{subj1.strip()} {verb} {predicate}", f"{subj2.strip()} {verb} {predicate}"]
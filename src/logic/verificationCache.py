@@ -0,0 +1,227 @@
+"""
+verificationCache.py — Two-tier cache of verify_assertion results
+
+An in-memory LRU sits in front of an on-disk SQLite store, so claims checked
+in earlier runs are not re-scored. Keys combine the normalized assertion,
+the source's identity and a hash of its registry entry, the persona, and a cache
+version: editing a source changes its hash, and bumping VERIFICATION_CACHE_VERSION
+when the scorer or model changes retires every earlier verdict.
+Entries expire after a TTL, and both tiers are trimmed to a size limit.
+Drafted collaboratively with Copilot and Bob Greenwade.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from editors.configEditor import get_config_value
+from segmentText import normalize_assertion
+
+VERIFICATION_CACHE_PATH = "verification_cache.db"
+# Bump whenever semantic_similarity_score, its model, or editorial_verdict changes
+VERIFICATION_CACHE_VERSION = 1
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MEMORY_ENTRIES = 10000
+DEFAULT_DISK_ENTRIES = 1000000
+
+# Disk size is checked once per this many writes
+_TRIM_EVERY = 256
+
+def source_fingerprint(source):
+    """
+    Stable hash of a source's full registry entry; changes whenever the entry does.
+    """
+    canonical = json.dumps(source, sort_keys=True, default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+class VerificationCache:
+    """
+    LRU memory tier plus optional SQLite disk tier (path=None keeps it memory-only).
+    """
+
+    def __init__(self, path=None, ttl_seconds=DEFAULT_TTL_SECONDS,
+                 max_memory_entries=DEFAULT_MEMORY_ENTRIES, max_disk_entries=DEFAULT_DISK_ENTRIES,
+                 version=VERIFICATION_CACHE_VERSION):
+        self.path = path
+        self.version = version
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory = OrderedDict()  # key → (expires_at, source_name, result)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writes = 0
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "expired": 0, "evictions": 0}
+        if path:
+            self._init_schema()
+
+    def make_key(self, assertion, source, persona="default"):
+        parts = [
+            self.version,
+            normalize_assertion(assertion),
+            source.get("name"),
+            source.get("url"),
+            source_fingerprint(source),
+            persona
+        ]
+        return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        conn = self._connect()
+        with conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS verifications (
+                    key TEXT PRIMARY KEY,
+                    source_name TEXT,
+                    result TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    expires REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_verifications_created ON verifications(created);
+                CREATE INDEX IF NOT EXISTS idx_verifications_source ON verifications(source_name);
+            """)
+
+    def _remember(self, key, expires, source_name, result):
+        self._memory[key] = (expires, source_name, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def get(self, key):
+        """
+        Returns a copy of the cached result, or None on a miss or expired entry.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return dict(entry[2])
+                del self._memory[key]
+                self.stats["expired"] += 1
+
+        if self.path:
+            row = self._connect().execute(
+                "SELECT source_name, result, expires FROM verifications WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[2] > now:
+                result = json.loads(row[1])
+                with self._lock:
+                    self._remember(key, row[2], row[0], result)
+                    self.stats["disk_hits"] += 1
+                return dict(result)
+            if row is not None:
+                with self._lock:
+                    self.stats["expired"] += 1
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def put(self, key, result, source_name=None):
+        now = time.time()
+        expires = now + self.ttl_seconds
+        with self._lock:
+            self._remember(key, expires, source_name, dict(result))
+            self.stats["stores"] += 1
+            self._writes += 1
+            trim = self._writes % _TRIM_EVERY == 0
+
+        if self.path:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO verifications (key, source_name, result, created, expires) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, source_name, json.dumps(result), now, expires)
+                )
+            if trim:
+                self.trim_disk()
+
+    def trim_disk(self):
+        """
+        Drops expired rows, then the oldest rows beyond max_disk_entries.
+        """
+        if not self.path:
+            return 0
+        conn = self._connect()
+        with conn:
+            removed = conn.execute("DELETE FROM verifications WHERE expires <= ?", (time.time(),)).rowcount
+            count = conn.execute("SELECT COUNT(*) FROM verifications").fetchone()[0]
+            if count > self.max_disk_entries:
+                removed += conn.execute(
+                    "DELETE FROM verifications WHERE key IN "
+                    "(SELECT key FROM verifications ORDER BY created LIMIT ?)",
+                    (count - self.max_disk_entries,)
+                ).rowcount
+        with self._lock:
+            self.stats["evictions"] += removed
+        return removed
+
+    def invalidate_source(self, source_name):
+        """
+        Drops every cached verdict that was checked against source_name.
+        """
+        with self._lock:
+            for key in [k for k, entry in self._memory.items() if entry[1] == source_name]:
+                del self._memory[key]
+        if self.path:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM verifications WHERE source_name = ?", (source_name,))
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        if self.path:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM verifications")
+
+    def report(self):
+        with self._lock:
+            hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+            lookups = hits + self.stats["misses"]
+            return {
+                **self.stats,
+                "memory_entries": len(self._memory),
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0
+            }
+
+# 🗄️ Shared Cache
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+def get_verification_cache():
+    """
+    Returns the shared cache configured from config.json, or None when
+    VERIFICATION_CACHE_ENABLED is false. Set VERIFICATION_CACHE_PATH to null for memory only.
+    """
+    global _shared_cache
+    if not get_config_value("VERIFICATION_CACHE_ENABLED", True):
+        return None
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = VerificationCache(
+                    path=get_config_value("VERIFICATION_CACHE_PATH", VERIFICATION_CACHE_PATH),
+                    ttl_seconds=get_config_value("VERIFICATION_CACHE_TTL", DEFAULT_TTL_SECONDS),
+                    max_memory_entries=get_config_value("VERIFICATION_CACHE_MEMORY_ENTRIES", DEFAULT_MEMORY_ENTRIES),
+                    max_disk_entries=get_config_value("VERIFICATION_CACHE_DISK_ENTRIES", DEFAULT_DISK_ENTRIES),
+                    version=get_config_value("VERIFICATION_CACHE_VERSION", VERIFICATION_CACHE_VERSION)
+                )
+    return _shared_cache
@@ -74,10 +74,11 @@ def summarize_sync_history():
         "unique_sources": list(set(g["source"] for g in glyph_registry)),
         "unique_targets": list(set(g["target"] for g in glyph_registry))
     }
-import json
 import os
 import requests
 from editors.configEditor import get_config_value
+from editors.registryEditor import load_registry, save_registry
+from editors.topicEditor import TOPIC_TREE_PATH, load_topic_tree, save_topic_tree
 
 def fetch_remote_json(url):
     try:
@@ -121,9 +122,11 @@ def merge_topic_trees(local, remote):
             merged[topic]["source_cluster"] = merged[topic].get("source_cluster") or data.get("source_cluster")
     return merged
 
-def sync_from_remote(registry_url, topic_url, local_registry_path, local_topic_path):
+def sync_from_remote(registry_url, topic_url, local_registry_path=None, local_topic_path=TOPIC_TREE_PATH):
     """
-    Fetches remote data and merges with local files.
+    Fetches remote data and merges it into the local registry and topic tree.
+    The registry is read from and written to the active store (see REGISTRY_BACKEND)
+    unless local_registry_path names a JSON file.
     """
     remote_registry = fetch_remote_json(registry_url)
     remote_topic_tree = fetch_remote_json(topic_url)
@@ -131,17 +134,13 @@ def sync_from_remote(registry_url, topic_url, local_registry_path, local_topic_p
     if "error" in remote_registry or "error" in remote_topic_tree:
         return {"status": "error", "details": [remote_registry.get("error"), remote_topic_tree.get("error")]}
 
-    with open(local_registry_path, "r", encoding="utf-8") as f:
-        local_registry = json.load(f)
-    with open(local_topic_path, "r", encoding="utf-8") as f:
-        local_topic_tree = json.load(f)
+    local_registry = load_registry(local_registry_path)
+    local_topic_tree = load_topic_tree(local_topic_path)
 
     merged_registry = merge_registries(local_registry, remote_registry)
     merged_topic_tree = merge_topic_trees(local_topic_tree, remote_topic_tree)
 
-    with open(local_registry_path, "w", encoding="utf-8") as f:
-        json.dump(merged_registry, f, indent=2)
-    with open(local_topic_path, "w", encoding="utf-8") as f:
-        json.dump(merged_topic_tree, f, indent=2)
+    save_registry(merged_registry, local_registry_path)
+    save_topic_tree(merged_topic_tree, local_topic_path)
 
     return {"status": "success", "merged": True}
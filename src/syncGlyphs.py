@@ -45,18 +45,20 @@ def describe_sync_ritual(glyph_obj):
 # 📜 Glyph Registry (Placeholder)
 glyph_registry = []
 
-def register_sync_glyph(glyph_obj):
+def register_sync_glyph(glyph_obj, announce=True):
     """
     Stores glyph metadata in the local registry.
     """
     glyph_registry.append(glyph_obj)
-    print(f"[GLYPH] Registered sync glyph: {glyph_obj['glyph']}")
+    if announce:
+        print(f"[GLYPH] Registered sync glyph: {glyph_obj['glyph']}")
 
 def get_sync_lineage(target_id):
     """
-    Returns all glyphs where the given target_id was the recipient.
+    Returns all glyphs where the given target_id was the recipient,
+    including batch glyphs that list it among their targets.
     """
-    return [g for g in glyph_registry if g["target"] == target_id]
+    return [g for g in glyph_registry if g["target"] == target_id or target_id in g.get("targets", ())]
 
 def summarize_sync_history():
     """
@@ -6,20 +6,19 @@ Drafted collaboratively with Copilot.
 """
 
 import os
-import json
 from datetime import datetime
-from editors.configEditor import get_config_value
+from editors.configEditor import get_config_value, get_config_snapshot
 
-BUFFER_SIZE = get_config_value("TRANSCRIPT_CONTEXT_BUFFER_SIZE", 10)
-
-# Load config
+# Load config (shared, mtime-checked snapshot from configEditor)
 def load_config(path="config.json"):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_config_snapshot(path)
 
 CONFIG = load_config()
 BUFFER_SIZE = CONFIG.get("TRANSCRIPT_CONTEXT_BUFFER_SIZE", 10)
 
+def get_buffer_size():
+    return get_config_value("TRANSCRIPT_CONTEXT_BUFFER_SIZE", BUFFER_SIZE)
+
 # Buffers and logs
 context_buffer = []
 transcript_log = []
@@ -28,7 +27,7 @@ transcript_trigger = None
 
 def update_context_buffer(turn):
     context_buffer.append(turn)
-    if len(context_buffer) > BUFFER_SIZE:
+    if len(context_buffer) > get_buffer_size():
         context_buffer.pop(0)
 
 def start_transcript(trigger_type="automatic"):
@@ -61,7 +60,7 @@ def save_transcript(username="User"):
         # 🧠 Transcript metadata block
         f.write(f"Transcript triggered by: {transcript_trigger}\n")
         f.write(f"Timestamp: {timestamp}\n")
-        f.write(f"Buffer size: {BUFFER_SIZE}\n\n")
+        f.write(f"Buffer size: {get_buffer_size()}\n\n")
 
         # 🗒️ Transcript entries
         for entry in transcript_log: